@@ -11,6 +11,8 @@ This bot implements fishing functionality with the following features:
 
 import time
 import random
+import queue
+import threading
 import pyautogui
 import cv2
 import numpy as np
@@ -21,9 +23,48 @@ import jake.path
 from jake.config_manager import ConfigurationManager
 from typing import Optional, Tuple, List
 
+# With fishing.pyautogui_click set to false, clicks go straight to user32 on
+# Windows, skipping pyautogui's per-call overhead and its post-action pause
+try:
+    import ctypes
+    _user32 = ctypes.windll.user32
+except (ImportError, AttributeError):
+    _user32 = None
+
+_MOUSEEVENTF_LEFTDOWN = 0x0002
+_MOUSEEVENTF_LEFTUP = 0x0004
+
+# mss keeps its screen DC and bitmap between grabs; without it every capture
+# goes through ImageGrab in screenshot_utils
+try:
+    import mss
+except ImportError:
+    mss = None
+
 class FishingBot:
     """Fishing bot that handles fishing spot detection and inventory polling."""
     
+    # Seconds before the cached window region is re-read
+    WINDOW_REFRESH_INTERVAL = 2.0
+    
+    # Polling line below the window center, in pixels
+    POLL_LINE_LENGTH = 200
+    POLL_LINE_WIDTH = 4
+    
+    # Strip around the polling line searched before the full window for a new spot
+    SPOT_STRIP_WIDTH = 200
+    SPOT_STRIP_HEIGHT = 300
+    
+    # Polling-line check cadence in seconds (fast after a click, backing off to the max)
+    MIN_POLL_INTERVAL = 0.25
+    MAX_POLL_INTERVAL = 1.0
+    
+    # Minimum seconds between polling-line debug screenshots
+    DEBUG_SAVE_INTERVAL = 5.0
+    
+    # Color of an empty inventory slot
+    EMPTY_SLOT_COLOR = "3E3529"
+    
     def __init__(self, config_file: str = "bot_config.json"):
         """
         Initialize the fishing bot.
@@ -41,12 +82,47 @@ class FishingBot:
         
         # Load fishing-specific settings
         self.fishing_spot_color = self.fishing_config.get("fishing_spot_color")
+        
+        # Parse the target color once; an invalid color fails here rather than on every poll
+        self._target_rgb = None
+        self._target_bgr = None
+        if self.fishing_spot_color:
+            try:
+                self._target_rgb = jake.color_utils.hex_to_rgb(self.fishing_spot_color)
+            except ValueError:
+                raise ValueError(f"Invalid fishing spot color: #{self.fishing_spot_color}")
+            self._target_bgr = self._target_rgb[::-1]
+        
         self.drop_boxes = self.fishing_config.get("drop_boxes", [])
         self.drop_interval = self.fishing_config.get("drop_interval", 5.0)
         self.fishing_delay = self.fishing_config.get("fishing_delay", 3.0)
         
+        # Drop boxes as parallel arrays (one entry per box) so the drop scan works on whole columns
+        self._x1 = np.array([box["x1"] for box in self.drop_boxes], dtype=np.int32)
+        self._y1 = np.array([box["y1"] for box in self.drop_boxes], dtype=np.int32)
+        self._x2 = np.array([box["x2"] for box in self.drop_boxes], dtype=np.int32)
+        self._y2 = np.array([box["y2"] for box in self.drop_boxes], dtype=np.int32)
+        self._colors = [box["color"] for box in self.drop_boxes]
+        
+        # Screen region (x, y, width, height) spanning every drop box, captured in one grab
+        self._inventory_region = None
+        if self.drop_boxes:
+            x0, y0 = int(self._x1.min()), int(self._y1.min())
+            self._inventory_region = (x0, y0, int(self._x2.max()) - x0 + 1, int(self._y2.max()) - y0 + 1)
+        
+        # Loop-invariant inputs of the drop scan: box centers (x, y) and the empty slot color in BGR
+        self._box_centers = np.stack([(self._x1 + self._x2) // 2, (self._y1 + self._y2) // 2], axis=1)
+        self._empty_bgr = np.array(jake.color_utils.hex_to_rgb(self.EMPTY_SLOT_COLOR)[::-1], dtype=np.int32)
+        
         # Load general bot settings
         self.human_movement = self.config.get("human_movement", {})
+        
+        # Resolve human-like movement once; the mover is shared by every click
+        self._human = self.human_movement.get("enabled", False)
+        self._mouse_mover = jake.path.BezierMouseMovement() if self._human else None
+        
+        # pyautogui clicks by default; direct user32 clicks only when opted out (and on Windows)
+        self._direct_click = _user32 is not None and not self.fishing_config.get("pyautogui_click", True)
         self.combat_config = self.config.get("combat", {})
         
         # Current fishing state
@@ -55,10 +131,28 @@ class FishingBot:
         
         # Debug settings
         self.debug_enabled = self.config.get("debug", {}).get("save_screenshots", True)
+        self._last_debug_save = float("-inf")
+        
+        # Per-poll and per-box detail lines are only printed with debug.verbose
+        self.verbose = self.config.get("debug", {}).get("verbose", False)
+        
+        # Debug screenshots are encoded and written by a background thread
+        self._debug_queue = None
+        if self.debug_enabled:
+            self._debug_queue = queue.Queue(maxsize=2)
+            threading.Thread(target=self._debug_writer, daemon=True).start()
         
         # Window detection
         self.window_title = "RuneLite"
         self.window_region = None
+        self._hwnd = None
+        self._window_region_expiry = 0.0
+        self._line_center_x = self._line_y_start = 0
+        self._line_region = None
+        self._wide_line_region = None
+        
+        # Persistent screen grabber reused by every capture
+        self._sct = mss.mss() if mss is not None else None
         
         print("Fishing Bot initialized")
         print(f"Fishing spot color: #{self.fishing_spot_color}")
@@ -70,37 +164,101 @@ class FishingBot:
     def find_runescape_window(self) -> Optional[Tuple[int, int, int, int]]:
         """
         Find the RuneScape window and return its coordinates (x, y, width, height)
+        
+        The window handle is cached after the first lookup, so later calls only
+        re-read its rectangle; the window list is searched again only once the
+        cached window has been closed.
         """
         try:
-            # Try to find window by title
             import win32gui
-            import win32con
             
-            def enum_windows_callback(hwnd, windows):
-                if win32gui.IsWindowVisible(hwnd):
-                    window_title = win32gui.GetWindowText(hwnd)
-                    if self.window_title.lower() in window_title.lower():
-                        rect = win32gui.GetWindowRect(hwnd)
-                        x, y, w, h = rect[0], rect[1], rect[2] - rect[0], rect[3] - rect[1]
-                        windows.append((x, y, w, h))
-                return True
+            # Fast path: the cached window still exists
+            if self._hwnd and win32gui.IsWindow(self._hwnd):
+                rect = win32gui.GetWindowRect(self._hwnd)
+                return (rect[0], rect[1], rect[2] - rect[0], rect[3] - rect[1])
             
-            windows = []
-            win32gui.EnumWindows(enum_windows_callback, windows)
-            
-            if windows:
-                return windows[0]  # Return the first matching window
-            else:
-                print(f"Could not find window with title containing '{self.window_title}'")
-                return None
+            self._hwnd, region = jake.screenshot_utils.find_window_handle(self.window_title)
+            return region
                 
         except ImportError:
             print("win32gui not available. Please install pywin32: pip install pywin32")
             return None
         except Exception as e:
-            print(f"Error finding window: {e}")
+            # find_window_handle's message already reads "Error finding window: ..."
+            self._hwnd = None
+            print(e)
             return None
     
+    def _click(self):
+        """Left click at the current cursor position."""
+        if self._direct_click:
+            # Keep pyautogui's corner abort: raises FailSafeException with the cursor in a corner
+            pyautogui.failSafeCheck()
+            _user32.mouse_event(_MOUSEEVENTF_LEFTDOWN, 0, 0, 0, 0)
+            _user32.mouse_event(_MOUSEEVENTF_LEFTUP, 0, 0, 0, 0)
+        else:
+            pyautogui.click()
+    
+    def _log(self, fmt: str, *args):
+        """Print a detail line; the message is only formatted when verbose output is on."""
+        if self.verbose:
+            print(fmt % args)
+    
+    def _ensure_window(self) -> bool:
+        """
+        Make sure self.window_region is set and reasonably fresh.
+        
+        The region is re-read at most every WINDOW_REFRESH_INTERVAL seconds so
+        a moved or resized window is picked up without a lookup on every poll.
+        
+        Returns:
+            True if the window region is available, False otherwise
+        """
+        now = time.monotonic()
+        if self.window_region is None or now > self._window_region_expiry:
+            previous_region = self.window_region
+            self.window_region = self.find_runescape_window()
+            if not self.window_region:
+                return False
+            self._window_region_expiry = now + self.WINDOW_REFRESH_INTERVAL
+            if self.window_region != previous_region:
+                self._update_polling_line()
+        return True
+    
+    def _update_polling_line(self):
+        """Recompute the polling line position for the current window region."""
+        window_x, window_y, window_width, window_height = self.window_region
+        
+        # Polling line: directly below the window center (window-relative center x and top y)
+        self._line_center_x = window_width // 2
+        self._line_y_start = window_height // 2
+        
+        # Screen region (x, y, width, height) captured on every poll
+        self._line_region = (window_x + self._line_center_x - self.POLL_LINE_WIDTH // 2,
+                             window_y + self._line_y_start,
+                             self.POLL_LINE_WIDTH, self.POLL_LINE_LENGTH)
+        
+        # Wider strip around the line, searched first for a replacement spot
+        strip_x = max(0, self._line_center_x - self.SPOT_STRIP_WIDTH // 2)
+        strip_y = max(0, self._line_y_start - (self.SPOT_STRIP_HEIGHT - self.POLL_LINE_LENGTH) // 2)
+        self._wide_line_region = (window_x + strip_x, window_y + strip_y,
+                                  min(self.SPOT_STRIP_WIDTH, window_width - strip_x),
+                                  min(self.SPOT_STRIP_HEIGHT, window_height - strip_y))
+    
+    def _grab(self, region: Tuple[int, int, int, int]) -> np.ndarray:
+        """
+        Capture a screen region (x, y, width, height) as a newly allocated BGR array.
+        
+        Uses the persistent mss grabber when available, otherwise
+        jake.screenshot_utils.capture_screen_region.
+        """
+        if self._sct is None:
+            return jake.screenshot_utils.capture_screen_region(region)
+        
+        x, y, w, h = region
+        bgra = np.asarray(self._sct.grab({"left": x, "top": y, "width": w, "height": h}))
+        return np.ascontiguousarray(bgra[:, :, :3])
+    
     def find_fishing_spot(self) -> Optional[Tuple[int, int]]:
         """
         Find a fishing spot with the target color.
@@ -114,41 +272,68 @@ class FishingBot:
         
         print(f"Searching for fishing spot with color #{self.fishing_spot_color}")
         
-        # Find RuneScape window if not already found
-        if self.window_region is None:
-            self.window_region = self.find_runescape_window()
-            if not self.window_region:
-                print("Could not find RuneScape window")
-                return None
-        
-        # Convert hex color to RGB
-        try:
-            rgb_color = jake.color_utils.hex_to_rgb(self.fishing_spot_color)
-        except ValueError:
-            print(f"Invalid fishing spot color: #{self.fishing_spot_color}")
+        # Find (or refresh) the RuneScape window
+        if not self._ensure_window():
+            print("Could not find RuneScape window")
             return None
         
+        return self._find_spot_in_region(self.window_region)
+    
+    def find_fishing_spot_near_line(self) -> Optional[Tuple[int, int]]:
+        """
+        Find a new fishing spot, searching the strip around the polling line first.
+        
+        The polling line runs through the spot that just ran out, so a fresh spot
+        is usually close by; the full window is only searched if the strip is empty.
+        
+        Returns:
+            Tuple of (x, y) coordinates if found, None otherwise
+        """
+        if not self.fishing_spot_color or not self._ensure_window():
+            return self.find_fishing_spot()
+        
+        spot = self._find_spot_in_region(self._wide_line_region, report_miss=False)
+        return spot if spot is not None else self.find_fishing_spot()
+    
+    def _find_spot_in_region(self, region: Tuple[int, int, int, int],
+                             report_miss: bool = True) -> Optional[Tuple[int, int]]:
+        """
+        Pick a pixel of the fishing spot color inside a screen region.
+        
+        Pixels are weighted by their distance to the window center (closer is more likely).
+        
+        Args:
+            region: Screen region (x, y, width, height) to search, inside the window
+            report_miss: Print a message when nothing matches
+            
+        Returns:
+            Tuple of (x, y) screen coordinates if found, None otherwise
+        """
         # Use pixel selection to find fishing spots
         tolerance = 20  # Color tolerance for fishing spots
         
-        # Capture screenshot of the RuneScape window
-        screenshot = jake.screenshot_utils.capture_screen_region(self.window_region)
+        # Capture screenshot of the region
+        screenshot = self._grab(region)
         if screenshot is None:
             print("Failed to capture screenshot")
             return None
         
-        # Convert hex color to hex string for the function
-        hex_color = jake.color_utils.rgb_to_hex(rgb_color)
+        # Search for pixels with the target color: per-channel bounds in BGR,
+        # clipped to the uint8 range (same test as find_pixels_by_color)
+        target_bgr = np.array(self._target_bgr, dtype=np.int16)
+        lower_bound = np.clip(target_bgr - tolerance, 0, 255).astype(np.uint8)
+        upper_bound = np.clip(target_bgr + tolerance, 0, 255).astype(np.uint8)
+        mask = cv2.inRange(screenshot, lower_bound, upper_bound)
         
-        # Search for pixels with the target color
-        matching_pixels = jake.color_utils.find_pixels_by_color(
-            screenshot, hex_color, tolerance
-        )
-        
-        if not matching_pixels:
-            print("No fishing spots found")
+        if cv2.countNonZero(mask) == 0:
+            if report_miss:
+                print("No fishing spots found")
             return None
         
+        # (x, y) of every matching pixel as an (N, 2) int32 array, in window coordinates
+        window_x, window_y = self.window_region[0], self.window_region[1]
+        pts = cv2.findNonZero(mask).reshape(-1, 2) + (region[0] - window_x, region[1] - window_y)
+        
         # Calculate window center coordinates
         window_width = self.window_region[2]
         window_height = self.window_region[3]
@@ -156,37 +341,31 @@ class FishingBot:
         center_y = window_height // 2
         
         # Calculate distances from center for all matching pixels
-        distances = []
-        for pixel in matching_pixels:
-            distance = ((pixel[0] - center_x) ** 2 + (pixel[1] - center_y) ** 2) ** 0.5
-            distances.append(distance)
+        dx = pts[:, 0] - center_x
+        dy = pts[:, 1] - center_y
+        distances = np.hypot(dx, dy)
         
         # Calculate probabilities based on distance (closer = higher probability)
         # Use inverse distance weighting: probability = 1 / (distance + 1)
-        # Add 1 to avoid division by zero
-        probabilities = [1.0 / (distance + 1) for distance in distances]
-        
-        # Normalize probabilities to sum to 1
-        total_prob = sum(probabilities)
-        if total_prob > 0:
-            normalized_probabilities = [p / total_prob for p in probabilities]
-        else:
-            # Fallback to uniform distribution if all probabilities are zero
-            normalized_probabilities = [1.0 / len(matching_pixels)] * len(matching_pixels)
+        # Add 1 to avoid division by zero; the weights are always positive
+        weights = 1.0 / (distances + 1.0)
         
-        # Select fishing spot based on weighted probability
-        best_spot = random.choices(matching_pixels, weights=normalized_probabilities, k=1)[0]
+        # Select fishing spot based on weighted probability: binary-search a uniform
+        # draw in the cumulative weights (no normalization needed)
+        cumulative = np.cumsum(weights)
+        idx = min(int(np.searchsorted(cumulative, np.random.rand() * cumulative[-1], side='right')), len(pts) - 1)
+        best_spot = (int(pts[idx, 0]), int(pts[idx, 1]))
         
-        # Find the distance of the selected spot for logging
-        selected_distance = ((best_spot[0] - center_x) ** 2 + (best_spot[1] - center_y) ** 2) ** 0.5
+        # Distance of the selected spot for logging
+        selected_distance = distances[idx]
         
         # Convert window coordinates to screen coordinates
-        window_x, window_y = self.window_region[0], self.window_region[1]
         screen_x = window_x + best_spot[0]
         screen_y = window_y + best_spot[1]
         
-        print(f"Found {len(matching_pixels)} fishing spots")
-        print(f"Selected spot at window ({best_spot[0]}, {best_spot[1]}) - screen ({screen_x}, {screen_y}) - distance: {selected_distance:.1f}px")
+        print(f"Found {len(pts)} fishing spots")
+        self._log("Selected spot at window (%d, %d) - screen (%d, %d) - distance: %.1fpx",
+                  best_spot[0], best_spot[1], screen_x, screen_y, selected_distance)
         return (screen_x, screen_y)
     
     def is_fishing_spot_active(self) -> bool:
@@ -199,64 +378,47 @@ class FishingBot:
         if not self.fishing_spot_color:
             return False
         
-        try:
-            rgb_color = jake.color_utils.hex_to_rgb(self.fishing_spot_color)
-        except ValueError:
+        # Find (or refresh) the RuneScape window
+        if not self._ensure_window():
+            print("Could not find RuneScape window")
             return False
         
-        # Find RuneScape window if not already found
-        if self.window_region is None:
-            self.window_region = self.find_runescape_window()
-            if not self.window_region:
-                print("Could not find RuneScape window")
-                return False
-        
-        # Calculate window center coordinates
-        window_width = self.window_region[2]
-        window_height = self.window_region[3]
-        center_x = window_width // 2
-        
-        # Define polling line: 200 pixels directly below center, 2 pixels wide
-        line_length = 200
-        line_width = 4
-        line_x_start = center_x - line_width // 2  # X coordinate (horizontal position)
-        line_y_start = window_height // 2  # Y coordinate (vertical position)
-        
         # Take a screenshot of the polling line area within the window
-        window_x, window_y = self.window_region[0], self.window_region[1]
-        region = (window_x + line_x_start, window_y + line_y_start, line_width, line_length)
-        screenshot = jake.screenshot_utils.capture_screen_region(region)
+        screenshot = self._grab(self._line_region)
         
         if screenshot is None:
             print("Failed to capture polling line screenshot")
             return False
         
-        # Check each pixel in the line for the fishing spot color
+        # Check every pixel in the line for the fishing spot color in one vectorized
+        # pass: same Euclidean tolerance as is_color_in_range, compared in BGR
         tolerance = 20
-        matching_pixels = 0
-        
-        # Check all pixels in the 2x200 rectangle
-        for y in range(line_length):
-            for x in range(2):  # 2 pixels wide
-                pixel_color = screenshot[y, x]  # Get pixel at (x, y) in the region
-                # Convert BGR to RGB
-                rgb_pixel = (pixel_color[2], pixel_color[1], pixel_color[0])
-                
-                # Check if color matches using color_utils
-                if jake.color_utils.is_color_in_range(rgb_pixel, rgb_color, tolerance):
-                    matching_pixels += 1
+        distances = jake.color_utils.calculate_color_distance(screenshot.astype(np.int32), self._target_bgr)
+        matching_pixels = int(np.count_nonzero(distances <= tolerance))
         
         # Consider fishing active if we find at least 1 matching pixel
         is_active = matching_pixels > 0
         
         # Take debug screenshot if no matching pixels found
         if matching_pixels == 0:
-            print(f"Fishing spot color not detected on polling line")
-            print(f"Checked {line_length * 2} pixels, found {matching_pixels} matches")
-            self.save_debug_screenshot_with_polling_line(is_active)
+            print("Fishing spot color not detected on polling line")
+            self._log("Checked %d pixels, found %d matches", distances.size, matching_pixels)
+            if self.debug_enabled:
+                self.save_debug_screenshot_with_polling_line(is_active)
         
         return is_active
     
+    def _debug_writer(self):
+        """Write queued debug screenshots to disk (runs on a background thread)."""
+        while True:
+            filepath, image = self._debug_queue.get()
+            try:
+                # Light compression: level 1 encodes several times faster than the default
+                cv2.imwrite(filepath, image, [cv2.IMWRITE_PNG_COMPRESSION, 1])
+                print(f"Debug screenshot saved: {filepath}")
+            except Exception as e:
+                print(f"Error saving debug screenshot: {e}")
+    
     def save_debug_screenshot_with_polling_line(self, is_active: bool):
         """
         Save a debug screenshot with the polling line highlighted.
@@ -267,36 +429,30 @@ class FishingBot:
         if not self.debug_enabled:
             return
         
+        # Rate-limit saves so a long dry spell does not rewrite the file every poll
+        now = time.monotonic()
+        if now - self._last_debug_save < self.DEBUG_SAVE_INTERVAL:
+            return
+        self._last_debug_save = now
+        
         try:
-            # Find RuneScape window if not already found
-            if self.window_region is None:
-                self.window_region = self.find_runescape_window()
-                if not self.window_region:
-                    return
-            
-            # Calculate window center coordinates
-            window_width = self.window_region[2]
-            window_height = self.window_region[3]
-            center_x = window_width // 2
+            # Find (or refresh) the RuneScape window
+            if not self._ensure_window():
+                return
             
-            # Define polling line coordinates
-            line_length = 200
-            line_width = 4
-            line_x_start = center_x  # X coordinate
-            line_y_start = window_height // 2  # Y coordinate
+            # Polling line coordinates (window-relative)
+            line_length = self.POLL_LINE_LENGTH
+            line_width = self.POLL_LINE_WIDTH
+            center_x = line_x_start = self._line_center_x
+            line_y_start = self._line_y_start
             
             # Take screenshot of the RuneLite window
-            screenshot = jake.screenshot_utils.capture_screen_region(self.window_region)
+            screenshot = self._grab(self.window_region)
             if screenshot is None:
                 return
             
-            # Convert to BGR for OpenCV drawing
-            if len(screenshot.shape) == 3 and screenshot.shape[2] == 3:
-                # Already BGR
-                debug_image = screenshot.copy()
-            else:
-                # Convert from RGB to BGR
-                debug_image = cv2.cvtColor(screenshot, cv2.COLOR_RGB2BGR)
+            # _grab always returns a freshly allocated BGR array, so annotate it in place
+            debug_image = screenshot
             
             # Draw polling line box
             # Make the box slightly larger for visibility (5 pixels wide)
@@ -359,8 +515,16 @@ class FishingBot:
             filename = f"fishing_polling_line_{status_text.lower()}.png"
             filepath = os.path.join(debug_dir, filename)
             
-            cv2.imwrite(filepath, debug_image)
-            print(f"Debug screenshot saved: {filepath}")
+            # Hand the image to the writer thread; when it is behind, drop the oldest
+            # pending image rather than stall the polling loop
+            try:
+                self._debug_queue.put_nowait((filepath, debug_image))
+            except queue.Full:
+                try:
+                    self._debug_queue.get_nowait()
+                    self._debug_queue.put_nowait((filepath, debug_image))
+                except (queue.Empty, queue.Full):
+                    pass
             
         except Exception as e:
             print(f"Error saving debug screenshot: {e}")
@@ -378,71 +542,67 @@ class FishingBot:
             return False
         
         # Filter drop boxes to only include those whose center is not empty
-        valid_boxes = []
-        empty_color = "3E3529"
-        
         print("Checking drop boxes for valid items...")
-        for i, box in enumerate(self.drop_boxes):
-            # Calculate center of the box
-            center_x = (box["x1"] + box["x2"]) // 2
-            center_y = (box["y1"] + box["y2"]) // 2
-            
-            # Get the color at the center of the box
-            try:
-                center_color = jake.screenshot_utils.get_pixel_color_at_position(center_x, center_y)
-                center_hex = jake.color_utils.rgb_to_hex(center_color)
-                
-                # Check if the center color is not the empty inventory color
-                empty_rgb = jake.color_utils.hex_to_rgb(empty_color)
-                if not jake.color_utils.is_color_in_range(center_color, empty_rgb, tolerance=10):
-                    valid_boxes.append((i, box))
-                    print(f"Drop box {i+1} center ({center_x}, {center_y}) has color #{center_hex} - valid")
-                else:
-                    print(f"Drop box {i+1} center ({center_x}, {center_y}) has color #{center_hex} - empty, skipping")
-                    
-            except Exception as e:
-                print(f"Error checking drop box {i+1} center color: {e}")
-                # If we can't check the color, include the box to be safe
-                valid_boxes.append((i, box))
-        
-        if not valid_boxes:
+        try:
+            # One capture of the inventory area covers every box center
+            x0, y0 = self._inventory_region[0], self._inventory_region[1]
+            inventory = self._grab(self._inventory_region)
+            centers = self._box_centers
+            center_colors = inventory[centers[:, 1] - y0, centers[:, 0] - x0]  # BGR, one row per box
+            
+            # Check which centers match the empty inventory color
+            is_empty = jake.color_utils.calculate_color_distance(center_colors.astype(np.int32), self._empty_bgr) <= 10
+        except Exception as e:
+            print(f"Error checking drop box center colors: {e}")
+            # If we can't check the colors, include every box to be safe
+            valid_boxes = np.arange(len(self.drop_boxes))
+        else:
+            if self.verbose:
+                for i in range(len(self.drop_boxes)):
+                    center_x, center_y = centers[i]
+                    b, g, r = center_colors[i]
+                    center_hex = jake.color_utils.rgb_to_hex((int(r), int(g), int(b)))
+                    status = "valid" if not is_empty[i] else "empty, skipping"
+                    self._log("Drop box %d center (%d, %d) has color #%s - %s", i + 1, center_x, center_y, center_hex, status)
+            valid_boxes = np.flatnonzero(~is_empty)
+        
+        if len(valid_boxes) == 0:
             print("No valid drop boxes found (all centers are empty)")
             return False
         
         # Shuffle the valid boxes to drop them in random order
-        random.shuffle(valid_boxes)
+        np.random.shuffle(valid_boxes)
+        
+        # Generate random coordinates within every bounding box at once
+        random_xs = np.random.randint(self._x1[valid_boxes], self._x2[valid_boxes] + 1)
+        random_ys = np.random.randint(self._y1[valid_boxes], self._y2[valid_boxes] + 1)
         
         print(f"Dropping {len(valid_boxes)} items in random order...")
         
         # Drop each valid box
-        for box_index, box in valid_boxes:
-            x1, y1 = box["x1"], box["y1"]
-            x2, y2 = box["x2"], box["y2"]
-            drop_color = box["color"]
-            
-            # Generate random coordinates within the bounding box
-            random_x = random.randint(x1, x2)
-            random_y = random.randint(y1, y2)
+        for box_index, random_x, random_y in zip(valid_boxes.tolist(), random_xs.tolist(), random_ys.tolist()):
+            x1, y1 = self._x1[box_index], self._y1[box_index]
+            x2, y2 = self._x2[box_index], self._y2[box_index]
+            drop_color = self._colors[box_index]
             
-            print(f"Dropping item from box {box_index+1}: ({x1}, {y1}) to ({x2}, {y2})")
-            print(f"Clicking at ({random_x}, {random_y}) with color #{drop_color}")
+            self._log("Dropping item from box %d: (%d, %d) to (%d, %d)", box_index + 1, x1, y1, x2, y2)
+            self._log("Clicking at (%d, %d) with color #%s", random_x, random_y, drop_color)
             
             try:
-                if self.human_movement.get("enabled", False):
+                if self._mouse_mover is not None:
                     # Use human-like movement
-                    mouse_mover = jake.path.BezierMouseMovement()
-                    mouse_mover.move_mouse_to(random_x, random_y)
+                    self._mouse_mover.move_mouse_to(random_x, random_y)
                 else:
                     # Direct movement
                     pyautogui.moveTo(random_x, random_y)
                 
                 # Click
-                pyautogui.click()
+                self._click()
                 
                 # Small delay between drops to avoid overwhelming the game
                 time.sleep(random.uniform(0.1, 0.3))
                 
-                print(f"Successfully dropped item from box {box_index+1}")
+                self._log("Successfully dropped item from box %d", box_index + 1)
                 
             except Exception as e:
                 print(f"Error dropping item from box {box_index+1}: {e}")
@@ -463,16 +623,15 @@ class FishingBot:
         print(f"Clicking fishing spot at ({spot[0]}, {spot[1]})")
         
         try:
-            if self.human_movement.get("enabled", False):
+            if self._mouse_mover is not None:
                 # Use human-like movement
-                mouse_mover = jake.mouse_movement.MouseMovement()
-                mouse_mover.move_mouse_to(spot[0], spot[1])
+                self._mouse_mover.move_mouse_to(spot[0], spot[1])
             else:
                 # Direct movement
                 pyautogui.moveTo(spot[0], spot[1])
             
             # Click
-            pyautogui.click()
+            self._click()
             
             self.current_fishing_spot = spot
             self.is_fishing = True
@@ -503,6 +662,11 @@ class FishingBot:
         # Monitor fishing progress with periodic dropping
         last_drop_time = time.time()
         
+        # Poll quickly right after a click, then back off toward MAX_POLL_INTERVAL;
+        # deadlines are kept on the monotonic clock so the cadence does not drift
+        poll_interval = self.MIN_POLL_INTERVAL
+        next_poll_at = time.monotonic()
+        
         while True:
             current_time = time.time()
             
@@ -528,6 +692,8 @@ class FishingBot:
                         self.wait_for_fishing_delay()
                         # Wait 4 seconds before monitoring again
                         time.sleep(4)
+                        poll_interval = self.MIN_POLL_INTERVAL
+                        next_poll_at = time.monotonic()
                     else:
                         print("Failed to restart fishing")
                         return False
@@ -541,8 +707,8 @@ class FishingBot:
             if not self.is_fishing_spot_active():
                 print("Current fishing spot ran out, finding new spot...")
                 
-                # Find and click a new fishing spot
-                new_fishing_spot = self.find_fishing_spot()
+                # Find and click a new fishing spot (near the old one first)
+                new_fishing_spot = self.find_fishing_spot_near_line()
                 if new_fishing_spot:
                     if self.click_fishing_spot(new_fishing_spot):
                         print("Successfully found and clicked new fishing spot")
@@ -550,6 +716,8 @@ class FishingBot:
                         self.wait_for_fishing_delay()
                         # Wait 4 seconds before monitoring again
                         time.sleep(4)
+                        poll_interval = self.MIN_POLL_INTERVAL
+                        next_poll_at = time.monotonic()
                     else:
                         print("Failed to click new fishing spot")
                         return False
@@ -557,8 +725,10 @@ class FishingBot:
                     print("No fishing spots available")
                     return False
             
-            # Wait a bit before checking again
-            time.sleep(1)
+            # Wait until the next poll is due
+            next_poll_at = max(next_poll_at + poll_interval, time.monotonic())
+            time.sleep(max(0.0, next_poll_at - time.monotonic()))
+            poll_interval = min(poll_interval * 1.3, self.MAX_POLL_INTERVAL)
     
     def run(self, max_cycles: Optional[int] = None):
         """
@@ -1,10 +1,12 @@
 import numpy as np
+from functools import lru_cache
 from typing import Tuple, List
 import cv2
 
+@lru_cache(maxsize=256)
 def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
     """
-    Convert hex color string to RGB tuple
+    Convert hex color string to RGB tuple (memoized; the result is an immutable tuple)
     
     Args:
         hex_color: Hex color string (e.g., "FF00FF" or "#FF00FF")
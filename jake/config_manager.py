@@ -8,8 +8,40 @@ bot configuration from JSON files.
 
 import json
 import os
+import tempfile
 from typing import Dict, Any, Optional, Tuple
 
+def write_file_atomic(path: str, data: bytes):
+    """
+    Write data to path via a temp file + rename, so an interrupted save never truncates it
+    
+    The temp file gets a unique name in the same directory, so concurrent writers
+    never share it and the final rename stays on one filesystem.
+    
+    Args:
+        path: Destination file
+        data: Complete file contents
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)),
+                                    prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def write_json_atomic(path: str, obj: Any):
+    """
+    Serialize obj as indented JSON and write it atomically (see write_file_atomic)
+    
+    Args:
+        path: Destination file
+        obj: JSON-serializable object
+    """
+    write_file_atomic(path, json.dumps(obj, indent=2).encode())
+
 class ConfigurationManager:
     """Manages bot configuration from JSON files."""
     
@@ -78,10 +110,17 @@ class ConfigurationManager:
                 "break_duration_max": 6
             },
             
+            # Fishing bot settings
+            "fishing": {
+                "enabled": False,
+                "pyautogui_click": True
+            },
+            
             # Debug settings
             "debug": {
                 "save_screenshots": True,
-                "screenshot_dir": "debug_screenshots"
+                "screenshot_dir": "debug_screenshots",
+                "verbose": False
             }
         }
     
@@ -98,8 +137,9 @@ class ConfigurationManager:
             return False
         
         try:
-            with open(self.config_file, 'r') as f:
-                loaded_config = json.load(f)
+            # Parse once from a single read; save_config writes self.config back without reloading
+            with open(self.config_file, 'rb') as f:
+                loaded_config = json.loads(f.read())
             
             # Merge loaded config with defaults (preserve defaults for missing keys)
             self._merge_config(loaded_config)
@@ -140,8 +180,7 @@ class ConfigurationManager:
             True if config saved successfully, False otherwise
         """
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            write_json_atomic(self.config_file, self.config)
             print(f"Configuration saved to {self.config_file}")
             return True
         except Exception as e:
@@ -16,7 +16,9 @@ import cv2
 import argparse
 
 # Add the parent directory to the Python path to import the bot modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _parent_dir not in sys.path:
+    sys.path.append(_parent_dir)
 
 from jake.bots.attack_bot import AttackBot
 from jake.config_manager import ConfigurationManager
@@ -10,6 +10,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox, colorchooser
 import json
 import os
+import re
 import sys
 import time
 import threading
@@ -18,10 +19,42 @@ from typing import Optional, Tuple, Dict, Any
 import pyautogui
 import jake.screenshot_utils
 import jake.color_utils
-from jake.config_manager import ConfigurationManager
+from jake.config_manager import ConfigurationManager, write_file_atomic
 
 # Add the parent directory to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _parent_dir not in sys.path:
+    sys.path.append(_parent_dir)
+
+# Accepts partial decimal input while typing, e.g. "", "1.", ".5"
+_FLOAT_RE = re.compile(r'^\d*\.?\d*$')
+
+# Config fields edited through integer entries (see _vcmd_int)
+_INT_FIELDS = {
+    ("food_area", "red_threshold"),
+    ("loot_pickup", "tolerance"),
+    ("loot_pickup", "max_distance"),
+    ("combat", "break_interval_min"),
+    ("combat", "break_interval_max"),
+    ("combat", "break_duration_min"),
+    ("combat", "break_duration_max"),
+}
+
+def _corner_tick_coords(x1: int, y1: int, x2: int, y2: int, size: int) -> list:
+    """
+    create_line coordinates for L-shaped tick marks on the four corners of an area.
+    
+    Each tick runs size pixels along both edges that meet at its corner, pointing
+    into the area whichever way the corners were dragged.
+    """
+    dx = size if x2 >= x1 else -size
+    dy = size if y2 >= y1 else -size
+    return [
+        [x1, y1 + dy, x1, y1, x1 + dx, y1],
+        [x2 - dx, y1, x2, y1, x2, y1 + dy],
+        [x2, y2 - dy, x2, y2, x2 - dx, y2],
+        [x1 + dx, y2, x1, y2, x1, y2 - dy],
+    ]
 
 def parse_arguments():
     """Parse command line arguments."""
@@ -31,6 +64,16 @@ def parse_arguments():
     return parser.parse_args()
 
 class ConfigGUI:
+    # Preview canvas element affected by each (section, key) config write
+    _PREVIEW_ELEMENTS = {
+        ("health_bar", "x"): "health_bar",
+        ("health_bar", "y"): "health_bar",
+        ("health_bar", "color"): "health_bar",
+        ("food_area", "enabled"): "food_area",
+        ("food_area", "coordinates"): "food_area",
+        ("loot_pickup", "inventory_area"): "inventory_area",
+    }
+    
     def __init__(self, config_file: str = "bot_config.json"):
         self.root = tk.Tk()
         self.root.title("RuneScape Bot Configuration")
@@ -39,6 +82,7 @@ class ConfigGUI:
         
         # Store config file path
         self.config_file = config_file
+        self._config_basename = os.path.basename(config_file)
         
         # Initialize configuration manager for defaults
         self.config_manager = ConfigurationManager(config_file)
@@ -51,6 +95,7 @@ class ConfigGUI:
         self.config["human_movement"]["speed_range"] = [0.5, 2.0]  # Normal speed
         self.config["combat"]["enable_breaks"] = True
         self.current_step = 0
+        self._on_review_step = False
         self.steps = [
             "Human Movement",
             "Health Bar",
@@ -65,6 +110,22 @@ class ConfigGUI:
         self.selection_start = None
         self.selection_end = None
         self.selection_canvas = None
+        self._overlay_pool = None  # (window, canvas) reused across selections
+        self._persistent_item_ids = []
+        self._last_drawn_snapshot: tuple = ()
+        self._drag_pending = False
+        
+        # Visual preview window and its cached canvas size
+        self.preview_window = None
+        self.preview_canvas = None
+        self._canvas_w = self._canvas_h = 0
+        self._preview_visible = False
+        self._preview_dirty = set()
+        self._preview_after = None
+        
+        # Recently found RuneScape window region (see _get_window_region)
+        self._window_region_cache = None
+        self._window_region_ts = 0.0
         
         # Track drawn elements for persistent display
         self.drawn_elements: Dict[str, Optional[Tuple[Any, ...]]] = {
@@ -73,9 +134,31 @@ class ConfigGUI:
             'inventory_area': None,  # (x1, y1, x2, y2)
         }
         
+        # Pending speed range write, committed once per idle cycle
+        self._pending_speed = None
+        self._speed_after = None
+        self._review_after = None
+        
+        # Review summary text, rebuilt only after a config change
+        self._review_summary = ""
+        self._review_dirty = True
+        
+        # Pre-rendered health bar marker (crosshair + dot), painted once
+        self._health_marker_img = self._build_health_marker_image()
+        
+        # Pattern tiles for the preview areas; per-area images are kept alive here
+        self._diagonal_tile = self._build_pattern_tile(20, "green", lambda i: (i, i))
+        self._grid_tile = self._build_pattern_tile(15, "blue", lambda i: (i, 0), lambda i: (0, i))
+        self._pattern_images = {}
+        
+        # Tk variables live for the whole GUI; step builders only bind widgets to them
+        self._create_vars()
+        
         # Setup GUI
         self._setup_gui()
         self._load_config()
+        self._sync_vars_from_config()
+        self._bind_var_traces()
         
     def _setup_gui(self):
         """Setup the main GUI layout."""
@@ -90,7 +173,7 @@ class ConfigGUI:
         main_frame.rowconfigure(2, weight=1)
         
         # Title with config file name
-        title_text = f"RuneScape Bot Configuration - {os.path.basename(self.config_file)}"
+        title_text = f"RuneScape Bot Configuration - {self._config_basename}"
         title_label = ttk.Label(main_frame, text=title_text, 
                                font=("Arial", 16, "bold"))
         title_label.grid(row=0, column=0, columnspan=2, pady=(0, 20))
@@ -127,63 +210,188 @@ class ConfigGUI:
         status_bar = ttk.Label(main_frame, textvariable=self.status_var, relief=tk.SUNKEN)
         status_bar.grid(row=5, column=0, columnspan=2, sticky="ew", pady=(10, 0))
         
+        # Key validators for numeric entries, so trace handlers only see numeric text
+        self._vcmd_int = (self.root.register(lambda P: P == "" or P.isdecimal()), "%P")
+        self._vcmd_float = (self.root.register(lambda P: _FLOAT_RE.match(P) is not None), "%P")
+        
         # Initialize first step
         self._show_step(0)
     
+    def _create_vars(self):
+        """Create one Tk variable per editable config field."""
+        self.vars = {
+            ("human_movement", "enabled"): tk.BooleanVar(),
+            ("human_movement", "speed_option"): tk.StringVar(),
+            ("human_movement", "speed_min"): tk.StringVar(),
+            ("human_movement", "speed_max"): tk.StringVar(),
+            ("food_area", "enabled"): tk.BooleanVar(),
+            ("food_area", "red_threshold"): tk.StringVar(),
+            ("loot_pickup", "enabled"): tk.BooleanVar(),
+            ("loot_pickup", "tolerance"): tk.StringVar(),
+            ("loot_pickup", "max_distance"): tk.StringVar(),
+            ("loot_pickup", "bury"): tk.BooleanVar(),
+            ("combat", "pixel_method"): tk.StringVar(),
+            ("combat", "random_mouse_movement"): tk.BooleanVar(),
+            ("combat", "enable_breaks"): tk.BooleanVar(),
+            ("combat", "break_interval_min"): tk.StringVar(),
+            ("combat", "break_interval_max"): tk.StringVar(),
+            ("combat", "break_duration_min"): tk.StringVar(),
+            ("combat", "break_duration_max"): tk.StringVar(),
+        }
+        
+        # Display and color entry variables
+        self.health_pos_var = tk.StringVar()
+        self.food_area_var = tk.StringVar()
+        self.inventory_area_var = tk.StringVar()
+        self.loot_color_var = tk.StringVar()
+        self.target_color_var = tk.StringVar()
+        
+        self._sync_vars_from_config()
+    
+    def _sync_vars_from_config(self):
+        """Copy current configuration values into the Tk variables."""
+        speed_range = self.config["human_movement"]["speed_range"]
+        for (section, key), var in self.vars.items():
+            if key == "speed_option":
+                continue
+            if key == "speed_min":
+                value = speed_range[0]
+            elif key == "speed_max":
+                value = speed_range[1]
+            else:
+                value = self.config[section][key]
+            if (section, key) in _INT_FIELDS:
+                # Integer entries only accept digits, so normalize e.g. 29.5 or -3 from the file
+                value = max(0, int(value))
+            var.set(value if isinstance(var, tk.BooleanVar) else str(value))
+        
+        self.loot_color_var.set(self.config["loot_pickup"]["loot_color"])
+        self.target_color_var.set(self.config["combat"]["default_target_color"])
+    
+    def _bind_var_traces(self):
+        """Attach write traces to the numeric and radio variables (once)."""
+        v = self.vars
+        v[("human_movement", "speed_min")].trace("w", self._on_custom_speed_changed)
+        v[("human_movement", "speed_max")].trace("w", self._on_custom_speed_changed)
+        v[("food_area", "red_threshold")].trace("w", self._make_int_field_trace("food_area", "red_threshold"))
+        v[("loot_pickup", "tolerance")].trace("w", self._make_int_field_trace("loot_pickup", "tolerance"))
+        v[("loot_pickup", "max_distance")].trace("w", self._make_int_field_trace("loot_pickup", "max_distance"))
+        v[("combat", "pixel_method")].trace(
+            "w", lambda *args: self._update_config("combat", "pixel_method", v[("combat", "pixel_method")].get()))
+        for key in ("break_interval_min", "break_interval_max", "break_duration_min", "break_duration_max"):
+            v[("combat", key)].trace("w", self._make_int_field_trace("combat", key))
+    
+    def _make_int_field_trace(self, section: str, key: str):
+        """Build a trace callback that writes an integer entry into the config."""
+        var = self.vars[(section, key)]
+        
+        def update(*args):
+            text = var.get()
+            if not text:
+                return
+            self._update_config(section, key, int(text))
+        
+        return update
+    
+    def _on_custom_speed_changed(self, *args):
+        """Apply the custom speed range entries once both hold a number."""
+        min_speed = self.vars[("human_movement", "speed_min")].get()
+        max_speed = self.vars[("human_movement", "speed_max")].get()
+        if min_speed in ("", ".") or max_speed in ("", "."):
+            return
+        self._update_speed_range([float(min_speed), float(max_speed)])
+    
+    def _build_health_marker_image(self, size: int = 20, radius: int = 5) -> tk.PhotoImage:
+        """Paint the health bar crosshair and dot into a PhotoImage once."""
+        dim = 2 * size + 1
+        img = tk.PhotoImage(width=dim, height=dim)
+        # Crosshair lines (2px wide), unpainted pixels stay transparent
+        img.put("red", to=(0, size - 1, dim, size + 1))
+        img.put("red", to=(size - 1, 0, size + 1, dim))
+        # Filled dot with a white outline, one horizontal span per row
+        outer = radius + 1
+        for dy in range(-outer, outer + 1):
+            for r, color in ((outer, "white"), (radius - 1, "red")):
+                if abs(dy) > r:
+                    continue
+                half = int((r * r - dy * dy) ** 0.5)
+                img.put(color, to=(size - half, size + dy, size + half + 1, size + dy + 1))
+        return img
+    
+    def _build_pattern_tile(self, size: int, color: str, *pixel_fns) -> tk.PhotoImage:
+        """Paint a size x size tile, one pixel per i in range(size) for each pixel function."""
+        tile = tk.PhotoImage(width=size, height=size)
+        for pixel_fn in pixel_fns:
+            for i in range(size):
+                px, py = pixel_fn(i)
+                tile.put(color, to=(px, py, px + 1, py + 1))
+        return tile
+    
+    def _draw_pattern(self, tile: tk.PhotoImage, element: str, x1: int, y1: int, x2: int, y2: int):
+        """Fill an area on the preview canvas with a tiled pattern in one image item."""
+        if x2 <= x1 or y2 <= y1:
+            return
+        image = tk.PhotoImage(width=x2 - x1, height=y2 - y1)
+        image.copy(tile, to=(0, 0, x2 - x1, y2 - y1))  # copy with a 'to' box tiles the source
+        self._pattern_images[element] = image
+        self.preview_canvas.create_image(x1, y1, image=image, anchor="nw", tags=("preview", element))
+    
     def _draw_persistent_elements(self):
         """Draw all configured elements on the overlay."""
         if not self.overlay_window or not self.selection_canvas:
             return
         
-        # Clear previous persistent elements
-        self.selection_canvas.delete("persistent")
+        # Nothing changed since the last draw on this canvas
+        snapshot = (self.drawn_elements['health_bar'],
+                    self.drawn_elements['food_area'],
+                    self.drawn_elements['inventory_area'])
+        if snapshot == self._last_drawn_snapshot:
+            return
+        self._last_drawn_snapshot = snapshot
+        
+        canvas = self.selection_canvas
+        
+        # Clear previous persistent elements by their remembered ids
+        if self._persistent_item_ids:
+            canvas.delete(*self._persistent_item_ids)
+        item_ids = self._persistent_item_ids = []
         
         # Draw health bar position
         if self.drawn_elements['health_bar']:
             x, y, color = self.drawn_elements['health_bar']
-            # Draw crosshair
-            size = 20
-            self.selection_canvas.create_line(x-size, y, x+size, y, fill="red", width=2, tags="persistent")
-            self.selection_canvas.create_line(x, y-size, x, y+size, fill="red", width=2, tags="persistent")
-            # Draw circle
-            self.selection_canvas.create_oval(x-5, y-5, x+5, y+5, fill="red", outline="white", width=2, tags="persistent")
+            # Draw pre-rendered crosshair and circle
+            item_ids.append(canvas.create_image(x, y, image=self._health_marker_img, tags="persistent"))
             # Draw label
-            self.selection_canvas.create_text(x, y-25, text="Health Bar", fill="red", font=("Arial", 10, "bold"), tags="persistent")
+            item_ids.append(canvas.create_text(x, y-25, text="Health Bar", fill="red", font=("Arial", 10, "bold"), tags="persistent"))
             # Draw color preview
-            self.selection_canvas.create_rectangle(x+15, y-10, x+35, y+10, fill=f"#{color}", outline="white", width=1, tags="persistent")
+            item_ids.append(canvas.create_rectangle(x+15, y-10, x+35, y+10, fill=f"#{color}", outline="white", width=1, tags="persistent"))
         
         # Draw food area
         if self.drawn_elements['food_area']:
             x1, y1, x2, y2 = self.drawn_elements['food_area']
             # Draw rectangle
-            self.selection_canvas.create_rectangle(x1, y1, x2, y2, outline="green", width=2, tags="persistent")
+            item_ids.append(canvas.create_rectangle(x1, y1, x2, y2, outline="green", width=2, tags="persistent"))
             # Draw label
-            self.selection_canvas.create_text((x1+x2)//2, y1-10, text="Food Area", fill="green", font=("Arial", 10, "bold"), tags="persistent")
+            item_ids.append(canvas.create_text((x1+x2)//2, y1-10, text="Food Area", fill="green", font=("Arial", 10, "bold"), tags="persistent"))
             # Draw corner indicators
-            corner_size = 8
-            for corner in [(x1, y1), (x2, y1), (x1, y2), (x2, y2)]:
-                cx, cy = corner
-                self.selection_canvas.create_oval(cx-corner_size, cy-corner_size, cx+corner_size, cy+corner_size, 
-                                                fill="green", outline="white", width=1, tags="persistent")
+            item_ids.extend(canvas.create_line(*tick, fill="green", width=4, tags="persistent")
+                            for tick in _corner_tick_coords(x1, y1, x2, y2, 12))
         
         # Draw inventory area
         if self.drawn_elements['inventory_area']:
             x1, y1, x2, y2 = self.drawn_elements['inventory_area']
             # Draw rectangle
-            self.selection_canvas.create_rectangle(x1, y1, x2, y2, outline="blue", width=2, tags="persistent")
+            item_ids.append(canvas.create_rectangle(x1, y1, x2, y2, outline="blue", width=2, tags="persistent"))
             # Draw label
-            self.selection_canvas.create_text((x1+x2)//2, y1-10, text="Inventory Area", fill="blue", font=("Arial", 10, "bold"), tags="persistent")
+            item_ids.append(canvas.create_text((x1+x2)//2, y1-10, text="Inventory Area", fill="blue", font=("Arial", 10, "bold"), tags="persistent"))
             # Draw corner indicators
-            corner_size = 8
-            for corner in [(x1, y1), (x2, y1), (x1, y2), (x2, y2)]:
-                cx, cy = corner
-                self.selection_canvas.create_oval(cx-corner_size, cy-corner_size, cx+corner_size, cy+corner_size, 
-                                                fill="blue", outline="white", width=1, tags="persistent")
+            item_ids.extend(canvas.create_line(*tick, fill="blue", width=4, tags="persistent")
+                            for tick in _corner_tick_coords(x1, y1, x2, y2, 12))
     
     def _update_drawn_elements(self):
         """Update drawn elements based on current configuration."""
         # Update health bar
-        health_config = self.config.get('health_bar', {})
+        health_config = self.config['health_bar']
         if health_config.get('x') is not None and health_config.get('y') is not None:
             self.drawn_elements['health_bar'] = (
                 health_config['x'], 
@@ -192,18 +400,19 @@ class ConfigGUI:
             )
         
         # Update food area
-        food_config = self.config.get('food_area', {})
+        food_config = self.config['food_area']
         if food_config.get('enabled') and food_config.get('coordinates'):
             self.drawn_elements['food_area'] = tuple(food_config['coordinates'])
         
         # Update inventory area
-        loot_config = self.config.get('loot_pickup', {})
+        loot_config = self.config['loot_pickup']
         if loot_config.get('inventory_area'):
             self.drawn_elements['inventory_area'] = tuple(loot_config['inventory_area'])
     
     def _show_step(self, step_index: int):
         """Show the specified configuration step."""
         self.current_step = step_index
+        self._on_review_step = step_index == len(self.steps) - 1
         self.progress_var.set(step_index + 1)
         self.step_label.config(text=f"Step {step_index + 1}: {self.steps[step_index]}")
         
@@ -235,7 +444,7 @@ class ConfigGUI:
     def _show_human_movement_step(self):
         """Show human movement configuration step."""
         # Enable/disable checkbox
-        enabled_var = tk.BooleanVar(value=self.config["human_movement"]["enabled"])
+        enabled_var = self.vars[("human_movement", "enabled")]
         enabled_check = ttk.Checkbutton(self.content_frame, text="Enable human-like mouse movement",
                                        variable=enabled_var, command=lambda: self._update_config("human_movement", "enabled", enabled_var.get()))
         enabled_check.pack(anchor=tk.W, pady=(0, 10))
@@ -260,7 +469,8 @@ class ConfigGUI:
                 current_option = text
                 break
         
-        speed_var = tk.StringVar(value=current_option)
+        speed_var = self.vars[("human_movement", "speed_option")]
+        speed_var.set(current_option)
         for text, values in speed_options:
             ttk.Radiobutton(speed_frame, text=text, variable=speed_var, value=text,
                            command=lambda t=text, v=values: self._update_speed_range(v)).pack(anchor=tk.W)
@@ -271,23 +481,14 @@ class ConfigGUI:
         
         ttk.Label(custom_frame, text="Custom range:").pack(side=tk.LEFT)
         
-        min_speed_var = tk.StringVar(value=str(self.config["human_movement"]["speed_range"][0]))
-        max_speed_var = tk.StringVar(value=str(self.config["human_movement"]["speed_range"][1]))
+        min_speed_var = self.vars[("human_movement", "speed_min")]
+        max_speed_var = self.vars[("human_movement", "speed_max")]
         
-        ttk.Entry(custom_frame, textvariable=min_speed_var, width=8).pack(side=tk.LEFT, padx=(5, 5))
+        ttk.Entry(custom_frame, textvariable=min_speed_var, width=8,
+                  validate="key", validatecommand=self._vcmd_float).pack(side=tk.LEFT, padx=(5, 5))
         ttk.Label(custom_frame, text="to").pack(side=tk.LEFT)
-        ttk.Entry(custom_frame, textvariable=max_speed_var, width=8).pack(side=tk.LEFT, padx=(5, 0))
-        
-        def update_custom_speed():
-            try:
-                min_speed = float(min_speed_var.get())
-                max_speed = float(max_speed_var.get())
-                self._update_speed_range([min_speed, max_speed])
-            except ValueError:
-                pass
-        
-        min_speed_var.trace("w", lambda *args: update_custom_speed())
-        max_speed_var.trace("w", lambda *args: update_custom_speed())
+        ttk.Entry(custom_frame, textvariable=max_speed_var, width=8,
+                  validate="key", validatecommand=self._vcmd_float).pack(side=tk.LEFT, padx=(5, 0))
     
     def _show_health_bar_step(self):
         """Show health bar configuration step."""
@@ -301,7 +502,6 @@ class ConfigGUI:
         pos_frame = ttk.LabelFrame(self.content_frame, text="Current Health Bar Position", padding="10")
         pos_frame.pack(fill=tk.X, pady=(0, 10))
         
-        self.health_pos_var = tk.StringVar()
         if self.config["health_bar"]["x"] is not None:
             self.health_pos_var.set(f"Position: ({self.config['health_bar']['x']}, {self.config['health_bar']['y']})\n"
                                    f"Color: #{self.config['health_bar']['color']}")
@@ -323,7 +523,7 @@ class ConfigGUI:
     def _show_food_area_step(self):
         """Show food area configuration step."""
         # Enable/disable checkbox
-        enabled_var = tk.BooleanVar(value=self.config["food_area"]["enabled"])
+        enabled_var = self.vars[("food_area", "enabled")]
         enabled_check = ttk.Checkbutton(self.content_frame, text="Enable auto-eating",
                                        variable=enabled_var, command=lambda: self._update_config("food_area", "enabled", enabled_var.get()))
         enabled_check.pack(anchor=tk.W, pady=(0, 10))
@@ -332,7 +532,6 @@ class ConfigGUI:
         area_frame = ttk.LabelFrame(self.content_frame, text="Food Area", padding="10")
         area_frame.pack(fill=tk.X, pady=(0, 10))
         
-        self.food_area_var = tk.StringVar()
         if self.config["food_area"]["coordinates"] is not None:
             coords = self.config["food_area"]["coordinates"]
             self.food_area_var.set(f"Area: ({coords[0]}, {coords[1]}) to ({coords[2]}, {coords[3]})")
@@ -347,19 +546,11 @@ class ConfigGUI:
         
         ttk.Label(threshold_frame, text="Red threshold for health monitoring:").pack(side=tk.LEFT)
         
-        threshold_var = tk.StringVar(value=str(self.config["food_area"]["red_threshold"]))
-        threshold_entry = ttk.Entry(threshold_frame, textvariable=threshold_var, width=10)
+        threshold_var = self.vars[("food_area", "red_threshold")]
+        threshold_entry = ttk.Entry(threshold_frame, textvariable=threshold_var, width=10,
+                                    validate="key", validatecommand=self._vcmd_int)
         threshold_entry.pack(side=tk.LEFT, padx=(10, 0))
         
-        def update_threshold(*args):
-            try:
-                threshold = int(threshold_var.get())
-                self._update_config("food_area", "red_threshold", threshold)
-            except ValueError:
-                pass
-        
-        threshold_var.trace("w", update_threshold)
-        
         # Buttons
         button_frame = ttk.Frame(self.content_frame)
         button_frame.pack(pady=(20, 0))
@@ -373,7 +564,7 @@ class ConfigGUI:
     def _show_loot_pickup_step(self):
         """Show loot pickup configuration step."""
         # Enable/disable checkbox
-        enabled_var = tk.BooleanVar(value=self.config["loot_pickup"]["enabled"])
+        enabled_var = self.vars[("loot_pickup", "enabled")]
         enabled_check = ttk.Checkbutton(self.content_frame, text="Enable loot pickup",
                                        variable=enabled_var, command=lambda: self._update_config("loot_pickup", "enabled", enabled_var.get()))
         enabled_check.pack(anchor=tk.W, pady=(0, 10))
@@ -385,7 +576,6 @@ class ConfigGUI:
         color_button_frame = ttk.Frame(color_frame)
         color_button_frame.pack()
         
-        self.loot_color_var = tk.StringVar(value=self.config["loot_pickup"]["loot_color"])
         ttk.Label(color_button_frame, text="Color:").pack(side=tk.LEFT)
         ttk.Entry(color_button_frame, textvariable=self.loot_color_var, width=12).pack(side=tk.LEFT, padx=(5, 10))
         
@@ -407,45 +597,28 @@ class ConfigGUI:
         tolerance_frame = ttk.Frame(settings_frame)
         tolerance_frame.pack(fill=tk.X, pady=(0, 5))
         ttk.Label(tolerance_frame, text="Color tolerance:").pack(side=tk.LEFT)
-        tolerance_var = tk.StringVar(value=str(self.config["loot_pickup"]["tolerance"]))
-        ttk.Entry(tolerance_frame, textvariable=tolerance_var, width=10).pack(side=tk.LEFT, padx=(10, 0))
+        tolerance_var = self.vars[("loot_pickup", "tolerance")]
+        ttk.Entry(tolerance_frame, textvariable=tolerance_var, width=10,
+                  validate="key", validatecommand=self._vcmd_int).pack(side=tk.LEFT, padx=(10, 0))
         
         # Max distance
         distance_frame = ttk.Frame(settings_frame)
         distance_frame.pack(fill=tk.X, pady=(0, 5))
         ttk.Label(distance_frame, text="Max distance:").pack(side=tk.LEFT)
-        distance_var = tk.StringVar(value=str(self.config["loot_pickup"]["max_distance"]))
-        ttk.Entry(distance_frame, textvariable=distance_var, width=10).pack(side=tk.LEFT, padx=(10, 0))
-        
-        # Update functions
-        def update_tolerance(*args):
-            try:
-                tolerance = int(tolerance_var.get())
-                self._update_config("loot_pickup", "tolerance", tolerance)
-            except ValueError:
-                pass
-        
-        def update_distance(*args):
-            try:
-                distance = int(distance_var.get())
-                self._update_config("loot_pickup", "max_distance", distance)
-            except ValueError:
-                pass
-        
-        tolerance_var.trace("w", update_tolerance)
-        distance_var.trace("w", update_distance)
+        distance_var = self.vars[("loot_pickup", "max_distance")]
+        ttk.Entry(distance_frame, textvariable=distance_var, width=10,
+                  validate="key", validatecommand=self._vcmd_int).pack(side=tk.LEFT, padx=(10, 0))
         
         # Inventory area for burying
         bury_frame = ttk.LabelFrame(self.content_frame, text="Burying Items", padding="10")
         bury_frame.pack(fill=tk.X, pady=(0, 10))
         
-        bury_var = tk.BooleanVar(value=self.config["loot_pickup"]["bury"])
+        bury_var = self.vars[("loot_pickup", "bury")]
         bury_check = ttk.Checkbutton(bury_frame, text="Enable burying items after pickup",
                                     variable=bury_var, command=lambda: self._update_config("loot_pickup", "bury", bury_var.get()))
         bury_check.pack(anchor=tk.W, pady=(0, 10))
         
         # Inventory area display
-        self.inventory_area_var = tk.StringVar()
         if self.config["loot_pickup"]["inventory_area"] is not None:
             coords = self.config["loot_pickup"]["inventory_area"]
             self.inventory_area_var.set(f"Area: ({coords[0]}, {coords[1]}) to ({coords[2]}, {coords[3]})")
@@ -473,7 +646,6 @@ class ConfigGUI:
         target_button_frame = ttk.Frame(target_frame)
         target_button_frame.pack()
         
-        self.target_color_var = tk.StringVar(value=self.config["combat"]["default_target_color"])
         ttk.Label(target_button_frame, text="Default target color:").pack(side=tk.LEFT)
         ttk.Entry(target_button_frame, textvariable=self.target_color_var, width=12).pack(side=tk.LEFT, padx=(5, 10))
         
@@ -491,28 +663,23 @@ class ConfigGUI:
         method_frame = ttk.LabelFrame(self.content_frame, text="Pixel Selection Method", padding="10")
         method_frame.pack(fill=tk.X, pady=(0, 10))
         
-        method_var = tk.StringVar(value=self.config["combat"]["pixel_method"])
+        method_var = self.vars[("combat", "pixel_method")]
         ttk.Radiobutton(method_frame, text="Smart (blob-based with green exclusion)", 
                        variable=method_var, value="smart").pack(anchor=tk.W)
         ttk.Radiobutton(method_frame, text="Random (original method)", 
                        variable=method_var, value="random").pack(anchor=tk.W)
         
-        def update_method(*args):
-            self._update_config("combat", "pixel_method", method_var.get())
-        
-        method_var.trace("w", update_method)
-        
         # Random mouse movement
         mouse_frame = ttk.LabelFrame(self.content_frame, text="Mouse Movement", padding="10")
         mouse_frame.pack(fill=tk.X, pady=(0, 10))
         
-        mouse_var = tk.BooleanVar(value=self.config["combat"]["random_mouse_movement"])
+        mouse_var = self.vars[("combat", "random_mouse_movement")]
         mouse_check = ttk.Checkbutton(mouse_frame, text="Enable random mouse movement during combat",
                                      variable=mouse_var, command=lambda: self._update_config("combat", "random_mouse_movement", mouse_var.get()))
         mouse_check.pack(anchor=tk.W)
         
         # Break system
-        break_var = tk.BooleanVar(value=self.config["combat"]["enable_breaks"])
+        break_var = self.vars[("combat", "enable_breaks")]
         break_check = ttk.Checkbutton(self.content_frame, text="Enable automatic breaks",
                                      variable=break_var, command=lambda: self._update_config("combat", "enable_breaks", break_var.get()))
         break_check.pack(anchor=tk.W, pady=(0, 5))
@@ -526,43 +693,28 @@ class ConfigGUI:
         interval_frame.pack(fill=tk.X, pady=(0, 5))
         ttk.Label(interval_frame, text="Break interval (minutes):").pack(side=tk.LEFT)
         
-        min_interval_var = tk.StringVar(value=str(self.config["combat"]["break_interval_min"]))
-        max_interval_var = tk.StringVar(value=str(self.config["combat"]["break_interval_max"]))
+        min_interval_var = self.vars[("combat", "break_interval_min")]
+        max_interval_var = self.vars[("combat", "break_interval_max")]
         
-        ttk.Entry(interval_frame, textvariable=min_interval_var, width=8).pack(side=tk.LEFT, padx=(10, 5))
+        ttk.Entry(interval_frame, textvariable=min_interval_var, width=8,
+                  validate="key", validatecommand=self._vcmd_int).pack(side=tk.LEFT, padx=(10, 5))
         ttk.Label(interval_frame, text="to").pack(side=tk.LEFT)
-        ttk.Entry(interval_frame, textvariable=max_interval_var, width=8).pack(side=tk.LEFT, padx=(5, 0))
+        ttk.Entry(interval_frame, textvariable=max_interval_var, width=8,
+                  validate="key", validatecommand=self._vcmd_int).pack(side=tk.LEFT, padx=(5, 0))
         
         # Break duration
         duration_frame = ttk.Frame(break_settings_frame)
         duration_frame.pack(fill=tk.X, pady=(0, 5))
         ttk.Label(duration_frame, text="Break duration (minutes):").pack(side=tk.LEFT)
         
-        min_duration_var = tk.StringVar(value=str(self.config["combat"]["break_duration_min"]))
-        max_duration_var = tk.StringVar(value=str(self.config["combat"]["break_duration_max"]))
+        min_duration_var = self.vars[("combat", "break_duration_min")]
+        max_duration_var = self.vars[("combat", "break_duration_max")]
         
-        ttk.Entry(duration_frame, textvariable=min_duration_var, width=8).pack(side=tk.LEFT, padx=(10, 5))
+        ttk.Entry(duration_frame, textvariable=min_duration_var, width=8,
+                  validate="key", validatecommand=self._vcmd_int).pack(side=tk.LEFT, padx=(10, 5))
         ttk.Label(duration_frame, text="to").pack(side=tk.LEFT)
-        ttk.Entry(duration_frame, textvariable=max_duration_var, width=8).pack(side=tk.LEFT, padx=(5, 0))
-        
-        def update_break_settings(*args):
-            try:
-                min_interval = int(min_interval_var.get())
-                max_interval = int(max_interval_var.get())
-                min_duration = int(min_duration_var.get())
-                max_duration = int(max_duration_var.get())
-                
-                self._update_config("combat", "break_interval_min", min_interval)
-                self._update_config("combat", "break_interval_max", max_interval)
-                self._update_config("combat", "break_duration_min", min_duration)
-                self._update_config("combat", "break_duration_max", max_duration)
-            except ValueError:
-                pass
-        
-        min_interval_var.trace("w", update_break_settings)
-        max_interval_var.trace("w", update_break_settings)
-        min_duration_var.trace("w", update_break_settings)
-        max_duration_var.trace("w", update_break_settings)
+        ttk.Entry(duration_frame, textvariable=max_duration_var, width=8,
+                  validate="key", validatecommand=self._vcmd_int).pack(side=tk.LEFT, padx=(5, 0))
     
     def _show_review_step(self):
         """Show review and save step."""
@@ -589,92 +741,110 @@ class ConfigGUI:
                   command=self._show_visual_preview).pack(side=tk.LEFT, padx=(0, 10))
         
         ttk.Button(preview_frame, text="Refresh Summary", 
-                  command=self._update_review_content).pack(side=tk.LEFT)
+                  command=lambda: self._update_review_content(force=True)).pack(side=tk.LEFT)
     
-    def _update_review_content(self):
-        """Update the review content with current configuration."""
-        summary_text = f"Configuration Summary - {os.path.basename(self.config_file)}\n"
-        summary_text += "=" * 50 + "\n\n"
+    def _update_review_content(self, force: bool = False):
+        """Update the review content, rebuilding the summary only if the config changed."""
+        if self._review_dirty or force:
+            self._review_summary = self._build_review_summary()
+            self._review_dirty = False
+        
+        # Update the text widget in a single call
+        self.review_text.replace("1.0", tk.END, self._review_summary)
+    
+    def _build_review_summary(self) -> str:
+        """Build the configuration summary text shown on the review step."""
+        parts = [f"Configuration Summary - {self._config_basename}\n"]
+        parts.append("=" * 50 + "\n\n")
         
         # Human movement
-        human_config = self.config.get("human_movement", {})
-        summary_text += f"Human-like Movement: {'Enabled' if human_config.get('enabled') else 'Disabled'}\n"
+        human_config = self.config["human_movement"]
+        parts.append(f"Human-like Movement: {'Enabled' if human_config.get('enabled') else 'Disabled'}\n")
         if human_config.get('enabled'):
             speed_range = human_config.get('speed_range', [0.5, 2.0])
-            summary_text += f"  Speed Range: {speed_range[0]:.1f}x to {speed_range[1]:.1f}x\n"
-        summary_text += "\n"
+            parts.append(f"  Speed Range: {speed_range[0]:.1f}x to {speed_range[1]:.1f}x\n")
+        parts.append("\n")
         
         # Health bar
-        health_config = self.config.get("health_bar", {})
+        health_config = self.config["health_bar"]
         if health_config.get('x') is not None:
-            summary_text += f"Health Bar: ({health_config['x']}, {health_config['y']})\n"
-            summary_text += f"  Color: #{health_config.get('color', 'N/A')}\n"
+            parts.append(f"Health Bar: ({health_config['x']}, {health_config['y']})\n")
+            parts.append(f"  Color: #{health_config.get('color', 'N/A')}\n")
         else:
-            summary_text += "Health Bar: Not configured\n"
-        summary_text += "\n"
+            parts.append("Health Bar: Not configured\n")
+        parts.append("\n")
         
         # Food area
-        food_config = self.config.get("food_area", {})
-        summary_text += f"Auto-eating: {'Enabled' if food_config.get('enabled') else 'Disabled'}\n"
+        food_config = self.config["food_area"]
+        parts.append(f"Auto-eating: {'Enabled' if food_config.get('enabled') else 'Disabled'}\n")
         if food_config.get('enabled'):
             coords = food_config.get('coordinates')
             if coords:
-                summary_text += f"  Food Area: ({coords[0]}, {coords[1]}) to ({coords[2]}, {coords[3]})\n"
-            summary_text += f"  Red Threshold: {food_config.get('red_threshold', 5)}\n"
-        summary_text += "\n"
+                parts.append(f"  Food Area: ({coords[0]}, {coords[1]}) to ({coords[2]}, {coords[3]})\n")
+            parts.append(f"  Red Threshold: {food_config.get('red_threshold', 5)}\n")
+        parts.append("\n")
         
         # Loot pickup
-        loot_config = self.config.get("loot_pickup", {})
-        summary_text += f"Loot Pickup: {'Enabled' if loot_config.get('enabled') else 'Disabled'}\n"
+        loot_config = self.config["loot_pickup"]
+        parts.append(f"Loot Pickup: {'Enabled' if loot_config.get('enabled') else 'Disabled'}\n")
         if loot_config.get('enabled'):
-            summary_text += f"  Loot Color: #{loot_config.get('loot_color', 'AA00FFFF')}\n"
-            summary_text += f"  Tolerance: {loot_config.get('tolerance', 20)}\n"
-            summary_text += f"  Max Distance: {loot_config.get('max_distance', 500)}\n"
-            summary_text += f"  Bury Items: {'Yes' if loot_config.get('bury') else 'No'}\n"
+            parts.append(f"  Loot Color: #{loot_config.get('loot_color', 'AA00FFFF')}\n")
+            parts.append(f"  Tolerance: {loot_config.get('tolerance', 20)}\n")
+            parts.append(f"  Max Distance: {loot_config.get('max_distance', 500)}\n")
+            parts.append(f"  Bury Items: {'Yes' if loot_config.get('bury') else 'No'}\n")
             
             inv_coords = loot_config.get('inventory_area')
             if inv_coords:
-                summary_text += f"  Inventory Area: ({inv_coords[0]}, {inv_coords[1]}) to ({inv_coords[2]}, {inv_coords[3]})\n"
-        summary_text += "\n"
+                parts.append(f"  Inventory Area: ({inv_coords[0]}, {inv_coords[1]}) to ({inv_coords[2]}, {inv_coords[3]})\n")
+        parts.append("\n")
         
         # Combat settings
-        combat_config = self.config.get("combat", {})
-        summary_text += f"Default Target Color: #{combat_config.get('default_target_color', '00FFFFFA')}\n"
-        summary_text += f"Pixel Method: {combat_config.get('pixel_method', 'smart')}\n"
-        summary_text += f"Random Mouse Movement: {'Enabled' if combat_config.get('random_mouse_movement') else 'Disabled'}\n"
-        summary_text += f"Automatic Breaks: {'Enabled' if combat_config.get('enable_breaks') else 'Disabled'}\n"
+        combat_config = self.config["combat"]
+        parts.append(f"Default Target Color: #{combat_config.get('default_target_color', '00FFFFFA')}\n")
+        parts.append(f"Pixel Method: {combat_config.get('pixel_method', 'smart')}\n")
+        parts.append(f"Random Mouse Movement: {'Enabled' if combat_config.get('random_mouse_movement') else 'Disabled'}\n")
+        parts.append(f"Automatic Breaks: {'Enabled' if combat_config.get('enable_breaks') else 'Disabled'}\n")
         
         if combat_config.get('enable_breaks'):
-            summary_text += f"  Break Intervals: {combat_config.get('break_interval_min', 29)}-{combat_config.get('break_interval_max', 33)} minutes\n"
-            summary_text += f"  Break Duration: {combat_config.get('break_duration_min', 2)}-{combat_config.get('break_duration_max', 6)} minutes\n"
+            parts.append(f"  Break Intervals: {combat_config.get('break_interval_min', 29)}-{combat_config.get('break_interval_max', 33)} minutes\n")
+            parts.append(f"  Break Duration: {combat_config.get('break_duration_min', 2)}-{combat_config.get('break_duration_max', 6)} minutes\n")
         
-        summary_text += "\n"
-        summary_text += f"Configuration will be saved to: {self.config_file}\n"
+        parts.append("\n")
+        parts.append(f"Configuration will be saved to: {self.config_file}\n")
         
-        # Update the text widget
-        self.review_text.delete(1.0, tk.END)
-        self.review_text.insert(tk.END, summary_text)
+        return "".join(parts)
     
     def _show_visual_preview(self):
         """Show visual preview of all configured elements."""
         # Find RuneScape window
-        window_region = jake.screenshot_utils.find_runescape_window("RuneLite")
+        window_region = self._get_window_region()
         if not window_region:
             messagebox.showerror("Error", "RuneScape window not found. Make sure RuneLite is running.")
             return
         
-        # Create preview overlay
-        self.preview_window = tk.Toplevel(self.root)
-        self.preview_window.title("Configuration Visual Preview")
-        self.preview_window.geometry(f"{window_region[2]}x{window_region[3]}+{window_region[0]}+{window_region[1]}")
-        self.preview_window.attributes('-topmost', True)
-        self.preview_window.attributes('-alpha', 0.3)
-        self.preview_window.overrideredirect(True)
-        
-        # Create canvas for drawing
-        self.preview_canvas = tk.Canvas(self.preview_window, width=window_region[2], height=window_region[3], 
-                                      bg='black', highlightthickness=0)
-        self.preview_canvas.pack()
+        geometry = f"{window_region[2]}x{window_region[3]}+{window_region[0]}+{window_region[1]}"
+        if self.preview_window is None:
+            # Create preview overlay (kept alive and hidden between previews)
+            self.preview_window = tk.Toplevel(self.root)
+            self.preview_window.title("Configuration Visual Preview")
+            self.preview_window.geometry(geometry)
+            self.preview_window.attributes('-topmost', True)
+            self.preview_window.attributes('-alpha', 0.3)
+            self.preview_window.overrideredirect(True)
+            
+            # Create canvas for drawing
+            self.preview_canvas = tk.Canvas(self.preview_window, width=window_region[2], height=window_region[3], 
+                                          bg='black', highlightthickness=0)
+            self.preview_canvas.pack()
+            
+            # Bind escape to close
+            self.preview_window.bind("<Escape>", lambda e: self._close_preview())
+        else:
+            # Reuse the hidden preview, following the RuneScape window if it moved
+            self.preview_window.geometry(geometry)
+            self.preview_canvas.config(width=window_region[2], height=window_region[3])
+            self.preview_window.deiconify()
+        self._canvas_w, self._canvas_h = window_region[2], window_region[3]
         
         # Draw all configured elements
         self._draw_all_configured_elements()
@@ -685,11 +855,9 @@ class ConfigGUI:
         self.preview_canvas.create_text(10, 50, text="Press Escape to close", 
                                       fill="white", font=("Arial", 10), anchor="nw")
         
-        # Bind escape to close
-        self.preview_window.bind("<Escape>", lambda e: self._close_preview())
-        
         # Focus the preview window
         self.preview_window.focus_set()
+        self._preview_visible = True
     
     def _draw_all_configured_elements(self):
         """Draw all configured elements on the preview canvas."""
@@ -698,95 +866,147 @@ class ConfigGUI:
         
         # Clear canvas
         self.preview_canvas.delete("all")
+        self._pattern_images = {}
+        self._preview_dirty.clear()
         
-        # Draw health bar position
-        health_config = self.config.get('health_bar', {})
-        if health_config.get('x') is not None and health_config.get('y') is not None:
-            x, y = health_config['x'], health_config['y']
-            color = health_config.get('color', '000000')
-            
-            # Draw crosshair
-            size = 25
-            self.preview_canvas.create_line(x-size, y, x+size, y, fill="red", width=3, tags="preview")
-            self.preview_canvas.create_line(x, y-size, x, y+size, fill="red", width=3, tags="preview")
-            
-            # Draw circle
-            self.preview_canvas.create_oval(x-8, y-8, x+8, y+8, fill="red", outline="white", width=2, tags="preview")
-            
-            # Draw label with background
-            label_text = "Health Bar"
-            self.preview_canvas.create_rectangle(x-40, y-35, x+40, y-15, fill="black", outline="red", width=2, tags="preview")
-            self.preview_canvas.create_text(x, y-25, text=label_text, fill="red", font=("Arial", 10, "bold"), tags="preview")
-            
-            # Draw color preview
-            self.preview_canvas.create_rectangle(x+45, y-12, x+65, y+12, fill=f"#{color}", outline="white", width=1, tags="preview")
-            self.preview_canvas.create_text(x+80, y, text=f"#{color}", fill="white", font=("Arial", 8), anchor="w", tags="preview")
-        
-        # Draw food area
-        food_config = self.config.get('food_area', {})
-        if food_config.get('enabled') and food_config.get('coordinates'):
-            x1, y1, x2, y2 = food_config['coordinates']
-            
-            # Draw rectangle with pattern
-            self.preview_canvas.create_rectangle(x1, y1, x2, y2, outline="green", width=3, tags="preview")
-            
-            # Draw diagonal pattern
-            for i in range(0, x2-x1, 20):
-                self.preview_canvas.create_line(x1+i, y1, x1+i+20, y2, fill="green", width=1, tags="preview")
-            
-            # Draw label with background
-            label_text = "Food Area"
-            label_x = (x1 + x2) // 2
-            label_y = y1 - 15
-            self.preview_canvas.create_rectangle(label_x-40, label_y-10, label_x+40, label_y+10, fill="black", outline="green", width=2, tags="preview")
-            self.preview_canvas.create_text(label_x, label_y, text=label_text, fill="green", font=("Arial", 10, "bold"), tags="preview")
-            
-            # Draw corner indicators
-            corner_size = 10
-            for corner in [(x1, y1), (x2, y1), (x1, y2), (x2, y2)]:
-                cx, cy = corner
-                self.preview_canvas.create_oval(cx-corner_size, cy-corner_size, cx+corner_size, cy+corner_size, 
-                                              fill="green", outline="white", width=2, tags="preview")
-        
-        # Draw inventory area
-        loot_config = self.config.get('loot_pickup', {})
-        if loot_config.get('inventory_area'):
-            x1, y1, x2, y2 = loot_config['inventory_area']
-            
-            # Draw rectangle with pattern
-            self.preview_canvas.create_rectangle(x1, y1, x2, y2, outline="blue", width=3, tags="preview")
-            
-            # Draw grid pattern
-            for i in range(0, x2-x1, 15):
-                self.preview_canvas.create_line(x1+i, y1, x1+i, y2, fill="blue", width=1, tags="preview")
-            for i in range(0, y2-y1, 15):
-                self.preview_canvas.create_line(x1, y1+i, x2, y1+i, fill="blue", width=1, tags="preview")
-            
-            # Draw label with background
-            label_text = "Inventory Area"
-            label_x = (x1 + x2) // 2
-            label_y = y1 - 15
-            self.preview_canvas.create_rectangle(label_x-50, label_y-10, label_x+50, label_y+10, fill="black", outline="blue", width=2, tags="preview")
-            self.preview_canvas.create_text(label_x, label_y, text=label_text, fill="blue", font=("Arial", 10, "bold"), tags="preview")
-            
-            # Draw corner indicators
-            corner_size = 10
-            for corner in [(x1, y1), (x2, y1), (x1, y2), (x2, y2)]:
-                cx, cy = corner
-                self.preview_canvas.create_oval(cx-corner_size, cy-corner_size, cx+corner_size, cy+corner_size, 
-                                              fill="blue", outline="white", width=2, tags="preview")
+        self._draw_preview_health_bar()
+        self._draw_preview_food_area()
+        self._draw_preview_inventory_area()
         
         # Draw legend
         self._draw_legend()
     
+    def _draw_preview_health_bar(self):
+        """Draw the health bar position on the preview canvas (tagged "health_bar")."""
+        canvas = self.preview_canvas
+        create_line = canvas.create_line
+        create_oval = canvas.create_oval
+        create_rectangle = canvas.create_rectangle
+        create_text = canvas.create_text
+        
+        health_config = self.config['health_bar']
+        x, y = health_config.get('x'), health_config.get('y')
+        if x is None or y is None:
+            return
+        color = health_config.get('color', '000000')
+        tags = ("preview", "health_bar")
+        
+        # Draw crosshair as one polyline (horizontal, back to center, vertical)
+        size = 25
+        create_line(x-size, y, x+size, y, x, y, x, y-size, x, y+size,
+                    fill="red", width=3, tags=tags)
+        
+        # Draw circle
+        create_oval(x-8, y-8, x+8, y+8, fill="red", outline="white", width=2, tags=tags)
+        
+        # Draw label with background
+        label_text = "Health Bar"
+        create_rectangle(x-40, y-35, x+40, y-15, fill="black", outline="red", width=2, tags=tags)
+        create_text(x, y-25, text=label_text, fill="red", font=("Arial", 10, "bold"), tags=tags)
+        
+        # Draw color preview
+        create_rectangle(x+45, y-12, x+65, y+12, fill=f"#{color}", outline="white", width=1, tags=tags)
+        create_text(x+80, y, text=f"#{color}", fill="white", font=("Arial", 8), anchor="w", tags=tags)
+    
+    def _draw_preview_food_area(self):
+        """Draw the food area on the preview canvas (tagged "food_area")."""
+        canvas = self.preview_canvas
+        create_rectangle = canvas.create_rectangle
+        create_text = canvas.create_text
+        create_line = canvas.create_line
+        
+        food_config = self.config['food_area']
+        food_coords = food_config.get('coordinates')
+        if not (food_config.get('enabled') and food_coords):
+            return
+        x1, y1, x2, y2 = food_coords
+        tags = ("preview", "food_area")
+        
+        # Draw rectangle with pattern
+        create_rectangle(x1, y1, x2, y2, outline="green", width=3, tags=tags)
+        
+        # Draw diagonal pattern
+        self._draw_pattern(self._diagonal_tile, "food_area", x1, y1, x2, y2)
+        
+        # Draw label with background
+        label_text = "Food Area"
+        label_x = (x1 + x2) // 2
+        label_y = y1 - 15
+        create_rectangle(label_x-40, label_y-10, label_x+40, label_y+10, fill="black", outline="green", width=2, tags=tags)
+        create_text(label_x, label_y, text=label_text, fill="green", font=("Arial", 10, "bold"), tags=tags)
+        
+        # Draw corner indicators
+        for tick in _corner_tick_coords(x1, y1, x2, y2, 15):
+            create_line(*tick, fill="green", width=5, tags=tags)
+    
+    def _draw_preview_inventory_area(self):
+        """Draw the inventory area on the preview canvas (tagged "inventory_area")."""
+        canvas = self.preview_canvas
+        create_rectangle = canvas.create_rectangle
+        create_text = canvas.create_text
+        create_line = canvas.create_line
+        
+        inventory_coords = self.config['loot_pickup'].get('inventory_area')
+        if not inventory_coords:
+            return
+        x1, y1, x2, y2 = inventory_coords
+        tags = ("preview", "inventory_area")
+        
+        # Draw rectangle with pattern
+        create_rectangle(x1, y1, x2, y2, outline="blue", width=3, tags=tags)
+        
+        # Draw grid pattern
+        self._draw_pattern(self._grid_tile, "inventory_area", x1, y1, x2, y2)
+        
+        # Draw label with background
+        label_text = "Inventory Area"
+        label_x = (x1 + x2) // 2
+        label_y = y1 - 15
+        create_rectangle(label_x-50, label_y-10, label_x+50, label_y+10, fill="black", outline="blue", width=2, tags=tags)
+        create_text(label_x, label_y, text=label_text, fill="blue", font=("Arial", 10, "bold"), tags=tags)
+        
+        # Draw corner indicators
+        for tick in _corner_tick_coords(x1, y1, x2, y2, 15):
+            create_line(*tick, fill="blue", width=5, tags=tags)
+    
+    def _mark_preview_dirty(self, element: str):
+        """Queue a redraw of one preview element if the preview is showing."""
+        if not self._preview_visible:
+            return
+        self._preview_dirty.add(element)
+        if self._preview_after is None:
+            self._preview_after = self.root.after_idle(self._redraw_dirty_preview)
+    
+    def _redraw_dirty_preview(self):
+        """Redraw only the preview elements queued by _mark_preview_dirty."""
+        self._preview_after = None
+        dirty, self._preview_dirty = self._preview_dirty, set()
+        if not self._preview_visible:
+            return
+        
+        draw = {
+            "health_bar": self._draw_preview_health_bar,
+            "food_area": self._draw_preview_food_area,
+            "inventory_area": self._draw_preview_inventory_area,
+        }
+        for element in dirty:
+            self.preview_canvas.delete(element)
+            self._pattern_images.pop(element, None)
+            draw[element]()
+    
     def _draw_legend(self):
         """Draw a legend explaining the visual elements."""
         if not self.preview_canvas:
             return
             
-        # Get canvas dimensions
-        canvas_width = self.preview_canvas.winfo_width()
-        canvas_height = self.preview_canvas.winfo_height()
+        canvas = self.preview_canvas
+        create_rectangle = canvas.create_rectangle
+        create_text = canvas.create_text
+        create_line = canvas.create_line
+        tags = ("preview", "legend")
+        
+        # Canvas dimensions cached when the preview window was sized
+        canvas_height = self._canvas_h
         
         # Position legend in bottom left
         legend_width = 200
@@ -795,34 +1015,33 @@ class ConfigGUI:
         legend_y = canvas_height - legend_height - 10  # 10 pixels from bottom
         
         # Legend background
-        self.preview_canvas.create_rectangle(legend_x, legend_y, legend_x+legend_width, legend_y+legend_height, 
-                                          fill="black", outline="white", width=2, tags="preview")
+        create_rectangle(legend_x, legend_y, legend_x+legend_width, legend_y+legend_height, 
+                         fill="black", outline="white", width=2, tags=tags)
         
         # Legend title
-        self.preview_canvas.create_text(legend_x+legend_width//2, legend_y+10, text="Legend", 
-                                      fill="white", font=("Arial", 12, "bold"), tags="preview")
+        create_text(legend_x+legend_width//2, legend_y+10, text="Legend", 
+                    fill="white", font=("Arial", 12, "bold"), tags=tags)
         
         # Health bar legend
-        self.preview_canvas.create_line(legend_x+10, legend_y+30, legend_x+30, legend_y+30, fill="red", width=3, tags="preview")
-        self.preview_canvas.create_text(legend_x+35, legend_y+30, text="Health Bar Position", 
-                                      fill="white", font=("Arial", 9), anchor="w", tags="preview")
+        create_line(legend_x+10, legend_y+30, legend_x+30, legend_y+30, fill="red", width=3, tags=tags)
+        create_text(legend_x+35, legend_y+30, text="Health Bar Position", 
+                    fill="white", font=("Arial", 9), anchor="w", tags=tags)
         
         # Food area legend
-        self.preview_canvas.create_rectangle(legend_x+10, legend_y+55, legend_x+30, legend_y+75, outline="green", width=2, tags="preview")
-        self.preview_canvas.create_text(legend_x+35, legend_y+65, text="Food Area", 
-                                      fill="white", font=("Arial", 9), anchor="w", tags="preview")
+        create_rectangle(legend_x+10, legend_y+55, legend_x+30, legend_y+75, outline="green", width=2, tags=tags)
+        create_text(legend_x+35, legend_y+65, text="Food Area", 
+                    fill="white", font=("Arial", 9), anchor="w", tags=tags)
         
         # Inventory area legend
-        self.preview_canvas.create_rectangle(legend_x+10, legend_y+80, legend_x+30, legend_y+100, outline="blue", width=2, tags="preview")
-        self.preview_canvas.create_text(legend_x+35, legend_y+90, text="Inventory Area", 
-                                      fill="white", font=("Arial", 9), anchor="w", tags="preview")
+        create_rectangle(legend_x+10, legend_y+80, legend_x+30, legend_y+100, outline="blue", width=2, tags=tags)
+        create_text(legend_x+35, legend_y+90, text="Inventory Area", 
+                    fill="white", font=("Arial", 9), anchor="w", tags=tags)
     
     def _close_preview(self):
-        """Close the visual preview window."""
-        if hasattr(self, 'preview_window') and self.preview_window:
-            self.preview_window.destroy()
-            self.preview_window = None
-            self.preview_canvas = None
+        """Hide the visual preview window so the next preview can reuse it."""
+        if self.preview_window:
+            self.preview_window.withdraw()
+            self._preview_visible = False
     
     def _prev_step(self):
         """Go to previous step."""
@@ -837,13 +1056,37 @@ class ConfigGUI:
     def _update_config(self, section: str, key: str, value: Any):
         """Update configuration value."""
         self.config[section][key] = value
-        if self.current_step == 5:  # Review step
-            self._update_review_content()
+        element = self._PREVIEW_ELEMENTS.get((section, key))
+        if element:
+            self._mark_preview_dirty(element)
+        self._review_dirty = True
+        if self._on_review_step:
+            self._schedule_review_update()
     
     def _update_speed_range(self, speed_range: list):
-        """Update speed range configuration."""
-        self.config["human_movement"]["speed_range"] = speed_range
-        if self.current_step == 5:  # Review step
+        """Update speed range configuration (coalesced until the GUI is idle)."""
+        self._pending_speed = speed_range
+        if self._speed_after is not None:
+            self.root.after_cancel(self._speed_after)
+        self._speed_after = self.root.after_idle(self._commit_speed_range)
+    
+    def _commit_speed_range(self):
+        """Write the most recent pending speed range to the configuration."""
+        self._speed_after = None
+        self.config["human_movement"]["speed_range"] = self._pending_speed
+        self._review_dirty = True
+        if self._on_review_step:
+            self._schedule_review_update()
+    
+    def _schedule_review_update(self):
+        """Rebuild the review summary once the current burst of edits settles."""
+        if self._review_after is None:
+            self._review_after = self.root.after_idle(self._flush_review_update)
+    
+    def _flush_review_update(self):
+        """Run the review rebuild queued by _schedule_review_update."""
+        self._review_after = None
+        if self._on_review_step:
             self._update_review_content()
     
     def _update_color_preview(self):
@@ -894,7 +1137,7 @@ class ConfigGUI:
         """Select health bar position with overlay."""
         def get_position():
             # Create overlay for position selection
-            self._create_position_selection_overlay("health_bar", "Select Health Bar Position")
+            self._create_overlay("health_bar", "Select Health Bar Position", "position")
             
             # Check if canvas was created successfully
             if self.selection_canvas:
@@ -920,9 +1163,9 @@ class ConfigGUI:
         hex_color = jake.color_utils.rgb_to_hex(rgb_color)
         
         # Update configuration
-        self.config["health_bar"]["x"] = x
-        self.config["health_bar"]["y"] = y
-        self.config["health_bar"]["color"] = hex_color
+        self._update_config("health_bar", "x", x)
+        self._update_config("health_bar", "y", y)
+        self._update_config("health_bar", "color", hex_color)
         
         # Update GUI
         self._update_health_bar_display(x, y, hex_color)
@@ -946,9 +1189,9 @@ class ConfigGUI:
     
     def _clear_health_bar_position(self):
         """Clear health bar position configuration."""
-        self.config["health_bar"]["x"] = None
-        self.config["health_bar"]["y"] = None
-        self.config["health_bar"]["color"] = None
+        self._update_config("health_bar", "x", None)
+        self._update_config("health_bar", "y", None)
+        self._update_config("health_bar", "color", None)
         self.health_pos_var.set("Not configured")
         
         # Update drawn elements
@@ -958,11 +1201,11 @@ class ConfigGUI:
     
     def _select_food_area(self):
         """Select food area with overlay."""
-        self._create_area_selection_overlay("food_area", "Select Food Area")
+        self._create_overlay("food_area", "Select Food Area", "area")
     
     def _clear_food_area(self):
         """Clear food area configuration."""
-        self.config["food_area"]["coordinates"] = None
+        self._update_config("food_area", "coordinates", None)
         self.food_area_var.set("Not configured")
         
         # Update drawn elements
@@ -972,11 +1215,11 @@ class ConfigGUI:
     
     def _select_inventory_area(self):
         """Select inventory area with overlay."""
-        self._create_area_selection_overlay("inventory_area", "Select Inventory Area")
+        self._create_overlay("inventory_area", "Select Inventory Area", "area")
     
     def _clear_inventory_area(self):
         """Clear inventory area configuration."""
-        self.config["loot_pickup"]["inventory_area"] = None
+        self._update_config("loot_pickup", "inventory_area", None)
         self.inventory_area_var.set("Not configured")
         
         # Update drawn elements
@@ -984,77 +1227,79 @@ class ConfigGUI:
         if self.overlay_window:
             self._draw_persistent_elements()
     
-    def _create_area_selection_overlay(self, config_key: str, title: str):
-        """Create overlay window for area selection."""
-        # Find RuneScape window
-        window_region = jake.screenshot_utils.find_runescape_window("RuneLite")
-        if not window_region:
-            messagebox.showerror("Error", "RuneScape window not found. Make sure RuneLite is running.")
-            return
-        
-        # Create overlay window
-        self.overlay_window = tk.Toplevel(self.root)
-        self.overlay_window.title(title)
-        self.overlay_window.geometry(f"{window_region[2]}x{window_region[3]}+{window_region[0]}+{window_region[1]}")
-        self.overlay_window.attributes('-topmost', True)
-        self.overlay_window.attributes('-alpha', 0.3)
-        self.overlay_window.overrideredirect(True)
-        
-        # Create canvas for drawing
-        self.selection_canvas = tk.Canvas(self.overlay_window, width=window_region[2], height=window_region[3], 
-                                        bg='black', highlightthickness=0)
-        self.selection_canvas.pack()
-        
-        # Draw persistent elements
-        self._draw_persistent_elements()
+    def _get_window_region(self, max_age: float = 2.0):
+        """
+        Find the RuneScape window, reusing a lookup made in the last max_age seconds.
         
-        # Bind mouse events
-        self.selection_canvas.bind("<Button-1>", self._on_selection_start)
-        self.selection_canvas.bind("<B1-Motion>", self._on_selection_drag)
-        self.selection_canvas.bind("<ButtonRelease-1>", self._on_selection_end)
+        Failed lookups are not cached, so starting RuneLite takes effect immediately.
+        """
+        now = time.monotonic()
+        if self._window_region_cache and now - self._window_region_ts < max_age:
+            return self._window_region_cache
         
-        # Add instructions
-        self.selection_canvas.create_text(10, 30, text="Click and drag to select area", 
-                                        fill="white", font=("Arial", 12, "bold"), anchor="nw")
-        self.selection_canvas.create_text(10, 50, text="Press Enter to confirm, Escape to cancel", 
-                                        fill="white", font=("Arial", 10), anchor="nw")
-        
-        # Bind keyboard events
-        self.overlay_window.bind("<Return>", self._on_selection_confirm)
-        self.overlay_window.bind("<Escape>", lambda e: self._close_overlay())
-        
-        # Store config key for later use
-        self.current_config_key = config_key
+        window_region = jake.screenshot_utils.find_runescape_window("RuneLite")
+        if window_region:
+            self._window_region_cache = window_region
+            self._window_region_ts = now
+        return window_region
     
-    def _create_position_selection_overlay(self, config_key: str, title: str):
-        """Create overlay window for position selection."""
+    def _create_overlay(self, config_key: str, title: str, mode: str):
+        """
+        Show the selection overlay on top of the RuneScape window.
+        
+        Args:
+            config_key: Configuration entry the selection is for
+            title: Overlay window title
+            mode: "area" for click-and-drag selection, "position" for a single pixel
+        """
         # Find RuneScape window
-        window_region = jake.screenshot_utils.find_runescape_window("RuneLite")
+        window_region = self._get_window_region()
         if not window_region:
             messagebox.showerror("Error", "RuneScape window not found. Make sure RuneLite is running.")
             return
         
-        # Create overlay window
-        self.overlay_window = tk.Toplevel(self.root)
-        self.overlay_window.title(title)
-        self.overlay_window.geometry(f"{window_region[2]}x{window_region[3]}+{window_region[0]}+{window_region[1]}")
-        self.overlay_window.attributes('-topmost', True)
-        self.overlay_window.attributes('-alpha', 0.3)
-        self.overlay_window.overrideredirect(True)
-        
-        # Create canvas for drawing
-        self.selection_canvas = tk.Canvas(self.overlay_window, width=window_region[2], height=window_region[3], 
-                                        bg='black', highlightthickness=0)
-        self.selection_canvas.pack()
-        
-        # Draw persistent elements
-        self._draw_persistent_elements()
-        
-        # Add instructions
-        self.selection_canvas.create_text(10, 30, text="Position your mouse on the target pixel", 
-                                        fill="white", font=("Arial", 12, "bold"), anchor="nw")
-        self.selection_canvas.create_text(10, 50, text="Position will be captured in 3 seconds", 
-                                        fill="white", font=("Arial", 10), anchor="nw")
+        if self._overlay_pool is None:
+            # Create overlay window and canvas (kept alive and hidden between selections)
+            window = tk.Toplevel(self.root)
+            window.attributes('-topmost', True)
+            window.attributes('-alpha', 0.3)
+            window.overrideredirect(True)
+            canvas = tk.Canvas(window, bg='black', highlightthickness=0)
+            canvas.pack()
+            window.bind("<Escape>", lambda e: self._close_overlay())
+            self._overlay_pool = (window, canvas)
+        else:
+            window, canvas = self._overlay_pool
+            window.deiconify()
+        
+        window.title(title)
+        window.geometry(f"{window_region[2]}x{window_region[3]}+{window_region[0]}+{window_region[1]}")
+        canvas.config(width=window_region[2], height=window_region[3])
+        self.overlay_window = window
+        self.selection_canvas = canvas
+        
+        # Draw persistent elements once the overlay has mapped
+        self.root.after_idle(self._draw_persistent_elements)
+        
+        create_text = canvas.create_text
+        if mode == "area":
+            # Bind mouse and keyboard events
+            canvas.bind("<Button-1>", self._on_selection_start)
+            canvas.bind("<B1-Motion>", self._on_selection_drag)
+            canvas.bind("<ButtonRelease-1>", self._on_selection_end)
+            window.bind("<Return>", self._on_selection_confirm)
+            
+            # Add instructions
+            create_text(10, 30, text="Click and drag to select area", 
+                        fill="white", font=("Arial", 12, "bold"), anchor="nw")
+            create_text(10, 50, text="Press Enter to confirm, Escape to cancel", 
+                        fill="white", font=("Arial", 10), anchor="nw")
+        else:
+            # Add instructions
+            create_text(10, 30, text="Position your mouse on the target pixel", 
+                        fill="white", font=("Arial", 12, "bold"), anchor="nw")
+            create_text(10, 50, text="Position will be captured in 3 seconds", 
+                        fill="white", font=("Arial", 10), anchor="nw")
         
         # Store config key for later use
         self.current_config_key = config_key
@@ -1065,10 +1310,17 @@ class ConfigGUI:
         self.selection_end = (event.x, event.y)
     
     def _on_selection_drag(self, event):
-        """Handle selection drag."""
+        """Handle selection drag (redraws coalesced to one per idle cycle)."""
         if self.selection_start:
             self.selection_end = (event.x, event.y)
-            self._draw_selection()
+            if not self._drag_pending:
+                self._drag_pending = True
+                self.selection_canvas.after_idle(self._flush_drag)
+    
+    def _flush_drag(self):
+        """Draw the latest drag position queued by _on_selection_drag."""
+        self._drag_pending = False
+        self._draw_selection()
     
     def _on_selection_end(self, event):
         """Handle selection end."""
@@ -1136,27 +1388,67 @@ class ConfigGUI:
         self._close_overlay()
     
     def _close_overlay(self):
-        """Close the overlay window."""
+        """Close the overlay window (hidden and reset for reuse)."""
         if self.overlay_window:
-            self.overlay_window.destroy()
+            canvas = self.selection_canvas
+            canvas.delete("all")
+            for sequence in ("<Button-1>", "<B1-Motion>", "<ButtonRelease-1>"):
+                canvas.unbind(sequence)
+            self.overlay_window.unbind("<Return>")
+            self.overlay_window.withdraw()
             self.overlay_window = None
             self.selection_canvas = None
+            self._persistent_item_ids = []
+            self._last_drawn_snapshot = ()
+            self._drag_pending = False
             self.selection_start = None
             self.selection_end = None
     
     def _save_config(self):
-        """Save configuration to file."""
+        """Save configuration to file (written atomically on a background thread)."""
+        config_file = self.config_file
+        
+        # Apply a speed range edit still waiting for the idle callback
+        if self._speed_after is not None:
+            self.root.after_cancel(self._speed_after)
+            self._commit_speed_range()
+        
         try:
-            config_file = self.config_file
-            with open(config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            # Serialize on the GUI thread so later edits cannot race the write
+            data = json.dumps(self.config, indent=2).encode()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save configuration: {e}")
+            print(f"Error saving configuration: {e}")
+            return
+        
+        # One save at a time; the button comes back once the write has reported in.
+        # Non-daemon, so closing the wizard mid-save still lets the write finish.
+        self.save_button.state(["disabled"])
+        threading.Thread(target=self._write_config_file, args=(config_file, data)).start()
+    
+    def _write_config_file(self, config_file: str, data: bytes):
+        """Write serialized config via a temp file + rename, then report back on the GUI thread."""
+        try:
+            write_file_atomic(config_file, data)
             
-            messagebox.showinfo("Configuration Saved", f"Configuration saved to {config_file}")
             print(f"Configuration saved to {config_file}")
+            self._after_save(messagebox.showinfo, "Configuration Saved", f"Configuration saved to {config_file}")
             
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to save configuration: {e}")
             print(f"Error saving configuration: {e}")
+            self._after_save(messagebox.showerror, "Error", f"Failed to save configuration: {e}")
+    
+    def _after_save(self, show, title: str, message: str):
+        """From the writer thread: re-enable Save and show the result on the GUI thread."""
+        def report():
+            self.save_button.state(["!disabled"])
+            show(title, message)
+        
+        try:
+            self.root.after(0, report)
+        except (RuntimeError, tk.TclError):
+            # The wizard was closed while saving; the console message above still stands
+            pass
     
     def _load_config(self):
         """Load existing configuration if available."""
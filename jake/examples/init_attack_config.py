@@ -6,32 +6,36 @@ This script helps you set up all the configuration parameters for the RuneScape
 in a single JSON file. Run this once to create your config, then use it with the bot.
 """
 
-import json
 import os
 import sys
-import time
-import pyautogui
-import jake.screenshot_utils
-import jake.color_utils
 
 # Add the parent directory to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _parent_dir not in sys.path:
+    sys.path.append(_parent_dir)
 
-def get_mouse_position_with_countdown(description: str, countdown: int = 5) -> tuple:
-    """Get mouse position with countdown."""
+def get_mouse_position_with_countdown(description: str, countdown: int = 5, sample_color: bool = True) -> tuple:
+    """Get mouse position with countdown (color is None when sample_color is False)."""
+    # Imported here so the prompts aren't held up by the GUI back-ends
+    import pyautogui
+    from jake import screenshot_utils, color_utils, setup_utils
+    
+    countdown = setup_utils.countdown_seconds(countdown)
+    
     print(f"\n{description}")
     print(f"You have {countdown} seconds to position your mouse...")
     
-    for i in range(countdown, 0, -1):
-        print(f"{i}...", end=" ", flush=True)
-        time.sleep(1)
-    print()
+    setup_utils.run_countdown(countdown)
     
     x, y = pyautogui.position()
-    rgb_color = jake.screenshot_utils.get_pixel_color_at_position(x, y)
-    hex_color = jake.color_utils.rgb_to_hex(rgb_color)
-    
     print(f"Position: ({x}, {y})")
+    
+    # Skip the screen grab when the caller only wants the position
+    if not sample_color:
+        return x, y, None
+    
+    rgb_color = screenshot_utils.get_pixel_color_at_position(x, y)
+    hex_color = color_utils.rgb_to_hex(rgb_color)
     print(f"Color: RGB{rgb_color} = #{hex_color}")
     
     return x, y, hex_color
@@ -42,11 +46,11 @@ def get_rectangle_coordinates(description: str) -> tuple:
     
     # Get first corner
     print("Step 1: Move mouse to first corner")
-    x1, y1, _ = get_mouse_position_with_countdown("Move mouse to first corner")
+    x1, y1, _ = get_mouse_position_with_countdown("Move mouse to first corner", sample_color=False)
     
     # Get second corner
     print("Step 2: Move mouse to opposite corner")
-    x2, y2, _ = get_mouse_position_with_countdown("Move mouse to opposite corner")
+    x2, y2, _ = get_mouse_position_with_countdown("Move mouse to opposite corner", sample_color=False)
     
     # Ensure coordinates are in correct order
     x1, x2 = min(x1, x2), max(x1, x2)
@@ -301,8 +305,8 @@ def init_config():
     
     if save_choice == 'y':
         try:
-            with open(config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            from jake.config_manager import write_json_atomic
+            write_json_atomic(config_file, config)
             print(f"Configuration saved to {config_file}")
             print(f"\nTo use this configuration, run:")
             print(f"python runescape_bot_example.py {config_file}")
@@ -7,41 +7,98 @@ It allows you to configure the minimap center and radius by clicking on the
 minimap center and a point on the perimeter.
 """
 
+import copy
 import json
 import os
 import sys
-import time
 import math
-import pyautogui
-import jake.screenshot_utils
-import jake.color_utils
-from jake.config_manager import ConfigurationManager
 
-def get_mouse_position_with_countdown(description: str, countdown: int = 5) -> tuple:
-    """Get mouse position with countdown."""
+def get_mouse_position_with_countdown(description: str, countdown: int = 5, sample_color: bool = True) -> tuple:
+    """Get mouse position with countdown (color is None when sample_color is False)."""
+    # Imported here so the prompts aren't held up by the GUI back-ends
+    import pyautogui
+    from jake import screenshot_utils, color_utils, setup_utils
+    
+    countdown = setup_utils.countdown_seconds(countdown)
+    
     print(f"\n{description}")
     print(f"You have {countdown} seconds to position your mouse...")
     
-    for i in range(countdown, 0, -1):
-        print(f"{i}...", end=" ", flush=True)
-        time.sleep(1)
-    print()
+    setup_utils.run_countdown(countdown)
     
     x, y = pyautogui.position()
-    rgb_color = jake.screenshot_utils.get_pixel_color_at_position(x, y)
-    hex_color = jake.color_utils.rgb_to_hex(rgb_color)
-    
     print(f"Position: ({x}, {y})")
+    
+    # Skip the screen grab when the caller only wants the position
+    if not sample_color:
+        return x, y, None
+    
+    rgb_color = screenshot_utils.get_pixel_color_at_position(x, y)
+    hex_color = color_utils.rgb_to_hex(rgb_color)
     print(f"Color: RGB{rgb_color} = #{hex_color}")
     
     return x, y, hex_color
 
 def calculate_radius(center_x: int, center_y: int, perimeter_x: int, perimeter_y: int) -> float:
     """Calculate the radius of the minimap circle."""
-    dx = perimeter_x - center_x
-    dy = perimeter_y - center_y
-    radius = math.sqrt(dx*dx + dy*dy)
-    return radius
+    return math.hypot(perimeter_x - center_x, perimeter_y - center_y)
+
+# Default fishing config; also used to fill in keys missing from an existing config
+_FISHING_DEFAULTS = {
+    "enabled": False,
+    "minimap": {
+        "center_x": None,
+        "center_y": None,
+        "radius": None
+    },
+    "fishing_spot_color": None,
+    "bank_color": None,
+    "drop_boxes": [],
+    "drop_interval": 30.0,
+    "travel_delay": 2.0,
+    "fishing_delay": 3.0
+}
+
+# Inventory slot layout used to auto-generate drop boxes. The slot pitch depends on
+# the client's UI scaling, so it is measured during setup rather than stored here.
+_INV_GRID = {
+    "columns": 4,
+    "slots": 16
+}
+
+def _grid_drop_boxes(x1: int, y1: int, width: int, height: int, dx: int, dy: int) -> list:
+    """
+    Drop boxes for the inventory slots after the first one, laid out on _INV_GRID
+    
+    Args:
+        x1, y1: Top-left corner of the first slot's box
+        width, height: Size of every box (taken from the first box)
+        dx, dy: Distance between the top-left corners of horizontally and
+                vertically neighbouring slots
+        
+    Returns:
+        One drop box dict per remaining slot, row by row, without a sampled color
+    """
+    columns = _INV_GRID["columns"]
+    boxes = []
+    for i in range(1, _INV_GRID["slots"]):
+        box_x = x1 + (i % columns) * dx
+        box_y = y1 + (i // columns) * dy
+        boxes.append({
+            "x1": box_x,
+            "y1": box_y,
+            "x2": box_x + width,
+            "y2": box_y + height,
+            "color": None
+        })
+    return boxes
+
+def _apply_fishing_defaults(fishing_config: dict) -> dict:
+    """Add any top-level keys missing from a fishing config, in place."""
+    for key, default in _FISHING_DEFAULTS.items():
+        if key not in fishing_config:
+            fishing_config[key] = copy.deepcopy(default)
+    return fishing_config
 
 def init_fishing_config():
     """Initialize the fishing bot minimap configuration."""
@@ -49,52 +106,15 @@ def init_fishing_config():
     print("This script will help you configure the minimap for the fishing bot.")
     print("Make sure RuneScape is running and the minimap is visible.\n")
     
+    # Imported here, not at module level: importing the jake package loads every bot
+    # (and OpenCV/pyautogui with them), which would otherwise delay the first prompt
+    from jake.config_manager import ConfigurationManager
+    
     # Load existing config or create new one
     config_manager = ConfigurationManager("bot_config.json")
     
-    # Initialize fishing config if it doesn't exist
-    if "fishing" not in config_manager.config:
-        config_manager.config["fishing"] = {
-            "enabled": False,
-            "minimap": {
-                "center_x": None,
-                "center_y": None,
-                "radius": None
-            },
-            "fishing_spot_color": None,
-            "bank_color": None,
-            "drop_boxes": [],
-            "drop_interval": 30.0,
-            "travel_delay": 2.0,
-            "fishing_delay": 3.0
-        }
-    else:
-        # Ensure all required keys exist in existing fishing config
-        fishing_config = config_manager.config["fishing"]
-        
-        # Initialize minimap if not present
-        if "minimap" not in fishing_config:
-            fishing_config["minimap"] = {
-                "center_x": None,
-                "center_y": None,
-                "radius": None
-            }
-        
-        # Initialize drop_boxes if not present
-        if "drop_boxes" not in fishing_config:
-            fishing_config["drop_boxes"] = []
-        
-        # Set defaults for missing keys
-        if "fishing_spot_color" not in fishing_config:
-            fishing_config["fishing_spot_color"] = None
-        if "bank_color" not in fishing_config:
-            fishing_config["bank_color"] = None
-        if "drop_interval" not in fishing_config:
-            fishing_config["drop_interval"] = 30.0
-        if "travel_delay" not in fishing_config:
-            fishing_config["travel_delay"] = 2.0
-        if "fishing_delay" not in fishing_config:
-            fishing_config["fishing_delay"] = 3.0
+    # Initialize the fishing config, backfilling any keys an older config is missing
+    config_manager.config["fishing"] = _apply_fishing_defaults(config_manager.config.get("fishing", {}))
     
     print("=== Minimap Configuration ===")
     print("You will need to click on two points on the minimap:")
@@ -104,15 +124,15 @@ def init_fishing_config():
     
     # Get minimap center
     print("\nStep 1: Minimap Center")
-    center_x, center_y, center_color = get_mouse_position_with_countdown(
-        "Move your mouse to the center of the minimap"
+    center_x, center_y, _ = get_mouse_position_with_countdown(
+        "Move your mouse to the center of the minimap", sample_color=False
     )
     
     # Get minimap perimeter point
     print("\nStep 2: Minimap Perimeter")
     print("Now click on any point on the edge/perimeter of the minimap")
-    perimeter_x, perimeter_y, perimeter_color = get_mouse_position_with_countdown(
-        "Move your mouse to a point on the minimap perimeter (edge)"
+    perimeter_x, perimeter_y, _ = get_mouse_position_with_countdown(
+        "Move your mouse to a point on the minimap perimeter (edge)", sample_color=False
     )
     
     # Calculate radius
@@ -177,8 +197,8 @@ def init_fishing_config():
             
             # Get top-right corner
             print("Step 2: Move mouse to top-right corner of the drop box")
-            top_right_x, top_right_y, top_right_color = get_mouse_position_with_countdown(
-                "Move your mouse to top-right corner of the first drop box"
+            top_right_x, top_right_y, _ = get_mouse_position_with_countdown(
+                "Move your mouse to top-right corner of the first drop box", sample_color=False
             )
             
             # Calculate box dimensions
@@ -212,6 +232,24 @@ def init_fishing_config():
                 except ValueError:
                     print("Invalid input, keeping default height")
             
+            # The inventory is a fixed grid, so the rest of the boxes can be laid out from the
+            # first one plus the slot pitch, measured from one more slot to follow UI scaling
+            remaining = _INV_GRID["slots"] - 1
+            grid_choice = input(f"Auto-generate the remaining {remaining} boxes on the {_INV_GRID['columns']}-column inventory grid? (y/n, default: n): ").strip().lower()
+            if grid_choice == 'y':
+                print("Step 3: Move mouse to the top-left corner of the slot one column right and one row down")
+                diagonal_x, diagonal_y, _ = get_mouse_position_with_countdown(
+                    "Move your mouse to the top-left corner of the second slot in the second row",
+                    sample_color=False
+                )
+                dx, dy = diagonal_x - x1, diagonal_y - y1
+                if dx > 0 and dy > 0:
+                    config_manager.config["fishing"]["drop_boxes"].extend(
+                        _grid_drop_boxes(x1, y1, first_box_width, first_box_height, dx, dy))
+                    print(f"Generated {remaining} more drop boxes spaced {dx} x {dy} pixels apart")
+                    break
+                print("That slot is not below and to the right of the first box; adding boxes one by one instead")
+            
         else:
             # Subsequent boxes: just specify center point
             print(f"For drop box {drop_boxes_count + 1}, just specify the center point.")
@@ -6,57 +6,145 @@ This script takes a bot configuration file and visualizes all the configured are
 by taking a screenshot of the RuneScape window and drawing labeled boxes on top.
 """
 
-import json
+from __future__ import annotations
+
 import os
 import sys
-import cv2
-import numpy as np
-import pyautogui
-import time
-from typing import Dict, Any, Optional, Tuple
+import threading
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Dict, Any, List, Optional, Tuple
 
 # Add the parent directory to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _parent_dir not in sys.path:
+    sys.path.append(_parent_dir)
+
+# OpenCV, numpy and jake.screenshot_utils are imported inside the functions that
+# use them, so usage errors and a missing config file exit without loading them
+
+# BGR colors for the different elements
+COLORS = SimpleNamespace(
+    health_bar=(0, 255, 0),        # Green
+    food_area=(0, 165, 255),       # Golden (BGR: 0, 165, 255 = RGB: 255, 165, 0)
+    inventory_area=(255, 0, 255),  # Magenta
+    loot_area=(255, 0, 0),         # Red
+    target_area=(0, 0, 255),       # Blue
+    minimap=(255, 255, 0),         # Cyan
+    fishing_spot=(0, 255, 255),    # Yellow
+    bank=(128, 0, 128),            # Purple
+    polling=(255, 165, 0)          # Orange
+)
+
+# Summary panel rows: (label, key path into the config, value format);
+# a None format renders the value as an Enabled/Disabled toggle
+SUMMARY_FIELDS = (
+    ("Human Movement", ("human_movement", "enabled"), None),
+    ("Auto-eating", ("food_area", "enabled"), None),
+    ("Loot Pickup", ("loot_pickup", "enabled"), None),
+    ("Fishing Bot", ("fishing", "enabled"), None),
+    ("Target Color", ("combat", "default_target_color"), "#{}"),
+    ("Pixel Method", ("combat", "pixel_method"), "{}"),
+)
+FISHING_SUMMARY_FIELDS = (
+    ("Travel Delay", ("fishing", "travel_delay"), "{}s"),
+    ("Fishing Delay", ("fishing", "fishing_delay"), "{}s"),
+)
+
+def _dig(config: Dict[str, Any], path: Tuple[str, ...]) -> Any:
+    """Follow a key path through nested dicts, returning None if any level is missing."""
+    value = config
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
 
-import jake.screenshot_utils
-import jake.color_utils
+def _summary_line(config: Dict[str, Any], label: str, path: Tuple[str, ...], fmt: Optional[str]) -> str:
+    """Render one summary panel row from SUMMARY_FIELDS."""
+    value = _dig(config, path)
+    if fmt is None:
+        return f"{label}: {'Enabled' if value else 'Disabled'}"
+    return f"{label}: " + fmt.format('Unknown' if value is None else value)
 
 def find_runescape_window(window_title: str = "RuneLite") -> Optional[Tuple[int, int, int, int]]:
     """
     Find the RuneScape window and return its coordinates (x, y, width, height)
     """
+    found = _find_window(window_title)
+    return found[1] if found else None
+
+def _find_window(window_title: str) -> Optional[Tuple[int, Tuple[int, int, int, int]]]:
+    """Find the first visible window whose title contains window_title: (hwnd, (x, y, width, height))."""
+    import jake.screenshot_utils
+    
+    try:
+        return jake.screenshot_utils.find_window_handle(window_title)
+    except ImportError:
+        print("win32gui not available. Please install pywin32: pip install pywin32")
+        return None
+    except Exception as e:
+        print(e)
+        return None
+
+def capture_window(hwnd: int, width: int, height: int) -> Optional[np.ndarray]:
+    """
+    Capture a window straight from its device context with BitBlt
+    
+    This skips the full ImageGrab/PIL path used by capture_screen_region.
+    
+    Args:
+        hwnd: Window handle
+        width: Window width (including frame, as reported by GetWindowRect)
+        height: Window height
+        
+    Returns:
+        BGR image array, or None if the capture failed or came back all black
+    """
+    import numpy as np
+    
     try:
-        # Try to find window by title
         import win32gui
+        import win32ui
         import win32con
         
-        def enum_windows_callback(hwnd, windows):
-            if win32gui.IsWindowVisible(hwnd):
-                window_title_text = win32gui.GetWindowText(hwnd)
-                if window_title.lower() in window_title_text.lower():
-                    rect = win32gui.GetWindowRect(hwnd)
-                    x, y, w, h = rect[0], rect[1], rect[2] - rect[0], rect[3] - rect[1]
-                    windows.append((x, y, w, h))
-            return True
-        
-        windows = []
-        win32gui.EnumWindows(enum_windows_callback, windows)
-        
-        if windows:
-            return windows[0]  # Return the first matching window
-        else:
-            print(f"Could not find window with title containing '{window_title}'")
-            return None
+        hwnd_dc = win32gui.GetWindowDC(hwnd)
+        src_dc = win32ui.CreateDCFromHandle(hwnd_dc)
+        mem_dc = src_dc.CreateCompatibleDC()
+        bitmap = win32ui.CreateBitmap()
+        try:
+            bitmap.CreateCompatibleBitmap(src_dc, width, height)
+            mem_dc.SelectObject(bitmap)
+            mem_dc.BitBlt((0, 0), (width, height), src_dc, (0, 0), win32con.SRCCOPY)
+            
+            # The bitmap bits are BGRA; drop alpha into a contiguous BGR array
+            bgra = np.frombuffer(bitmap.GetBitmapBits(True), dtype=np.uint8).reshape(height, width, 4)
+            
+            # GPU/DWM-composited windows (e.g. RuneLite's GPU plugin) BitBlt as an
+            # all-black frame without raising; treat that as a failed capture
+            if not bgra[..., :3].any():
+                print("BitBlt returned a blank frame, falling back to screen capture")
+                return None
+            return np.ascontiguousarray(bgra[:, :, :3])
+        finally:
+            win32gui.DeleteObject(bitmap.GetHandle())
+            mem_dc.DeleteDC()
+            src_dc.DeleteDC()
+            win32gui.ReleaseDC(hwnd, hwnd_dc)
             
-    except ImportError:
-        print("win32gui not available. Please install pywin32: pip install pywin32")
-        return None
     except Exception as e:
-        print(f"Error finding window: {e}")
+        print(f"BitBlt capture failed, falling back to screen capture: {e}")
         return None
 
+@lru_cache(maxsize=256)
+def _text_size(text: str, font: int, font_scale: float, thickness: int) -> Tuple[Tuple[int, int], int]:
+    """Memoized cv2.getTextSize: ((width, height), baseline)."""
+    import cv2
+    return cv2.getTextSize(text, font, font_scale, thickness)
+
 def draw_labeled_box(image: np.ndarray, coords: Tuple[int, int, int, int], 
-                    label: str, color: Tuple[int, int, int], thickness: int = 2) -> np.ndarray:
+                    label: str, color: Tuple[int, int, int], thickness: int = 2,
+                    labels: Optional[List[tuple]] = None) -> np.ndarray:
     """
     Draw a labeled box on the image
     
@@ -66,38 +154,33 @@ def draw_labeled_box(image: np.ndarray, coords: Tuple[int, int, int, int],
         label: Text label for the box
         color: BGR color tuple
         thickness: Line thickness
+        labels: If given, the label is queued here for draw_labels instead of drawn now
         
     Returns:
         Modified image with box and label
     """
+    import cv2
+    
     x1, y1, x2, y2 = coords
     
     # Draw rectangle
     cv2.rectangle(image, (x1, y1), (x2, y2), color, thickness)
     
-    # Draw label background
-    font = cv2.FONT_HERSHEY_SIMPLEX
-    font_scale = 0.6
-    (text_width, text_height), baseline = cv2.getTextSize(label, font, font_scale, thickness)
-    
     # Position label above the box
+    font_scale = 0.6
+    (text_width, text_height), baseline = _text_size(label, cv2.FONT_HERSHEY_SIMPLEX, font_scale, thickness)
     label_x = x1
     label_y = max(y1 - 10, text_height + 5)  # Ensure label is visible
     
-    # Draw label background rectangle
-    cv2.rectangle(image, 
-                  (label_x - 2, label_y - text_height - 2),
-                  (label_x + text_width + 2, label_y + baseline + 2),
-                  color, -1)  # Filled rectangle
-    
-    # Draw label text
-    cv2.putText(image, label, (label_x, label_y), font, font_scale, (255, 255, 255), thickness)
+    _add_label(image, labels, label, (label_x, label_y), font_scale, thickness,
+               (text_width, text_height), baseline, color)
     
     return image
 
 def draw_point_with_label(image: np.ndarray, point: Tuple[int, int], 
                          label: str, color: Tuple[int, int, int], 
-                         radius: int = 5, thickness: int = 2) -> np.ndarray:
+                         radius: int = 5, thickness: int = 2,
+                         labels: Optional[List[tuple]] = None) -> np.ndarray:
     """
     Draw a labeled point on the image
     
@@ -108,49 +191,311 @@ def draw_point_with_label(image: np.ndarray, point: Tuple[int, int],
         color: BGR color tuple
         radius: Circle radius
         thickness: Line thickness
+        labels: If given, the label is queued here for draw_labels instead of drawn now
         
     Returns:
         Modified image with point and label
     """
+    import cv2
+    
     x, y = point
     
     # Draw circle
     cv2.circle(image, (x, y), radius, color, thickness)
     
-    # Draw label
-    font = cv2.FONT_HERSHEY_SIMPLEX
-    font_scale = 0.5
-    (text_width, text_height), baseline = cv2.getTextSize(label, font, font_scale, thickness)
-    
     # Position label to the right of the point
+    font_scale = 0.5
+    (text_width, text_height), baseline = _text_size(label, cv2.FONT_HERSHEY_SIMPLEX, font_scale, thickness)
     label_x = x + radius + 5
     label_y = y + text_height // 2
     
-    # Draw label background rectangle
-    cv2.rectangle(image, 
-                  (label_x - 2, label_y - text_height - 2),
-                  (label_x + text_width + 2, label_y + baseline + 2),
-                  color, -1)  # Filled rectangle
+    _add_label(image, labels, label, (label_x, label_y), font_scale, thickness,
+               (text_width, text_height), baseline, color)
+    
+    return image
+
+def draw_color_indicator(image: np.ndarray, label: str, bgr_color: Tuple[int, int, int],
+                         border_color: Tuple[int, int, int], y: int, x: int = 10, size: int = 20,
+                         labels: Optional[List[tuple]] = None) -> np.ndarray:
+    """
+    Draw a small filled color swatch with a border and a label to its right
+    
+    Args:
+        image: OpenCV image to draw on
+        label: Text shown next to the swatch
+        bgr_color: Swatch fill color
+        border_color: Border and label text color
+        y: Top edge of the swatch
+        x: Left edge of the swatch
+        size: Swatch side length in pixels
+        labels: If given, the label is queued here for draw_labels instead of drawn now
+        
+    Returns:
+        Modified image with the swatch and label
+    """
+    import cv2
+    
+    # Fill with a slice store, then draw the border over its edge
+    _fill_rect(image, x, y, x + size, y + size, bgr_color)
+    cv2.rectangle(image, (x, y), (x + size, y + size), border_color, 2)
+    
+    # Label without a background
+    _add_label(image, labels, label, (x + size + 5, y + 15), 0.5, 2, (0, 0), 0, None, border_color)
+    
+    return image
+
+def _add_label(image: np.ndarray, labels: Optional[List[tuple]], text: str,
+               origin: Tuple[int, int], font_scale: float, thickness: int,
+               text_size: Tuple[int, int], baseline: int,
+               bg_color: Optional[Tuple[int, int, int]],
+               text_color: Tuple[int, int, int] = (255, 255, 255)):
+    """Queue a label (or draw it straight away when there is no queue)."""
+    label_x, label_y = origin
+    text_width, text_height = text_size
+    bg_rect = (label_x - 2, label_y - text_height - 2, label_x + text_width + 2, label_y + baseline + 2)
+    record = (bg_rect, bg_color, text, origin, font_scale, text_color, thickness)
+    if labels is None:
+        draw_labels(image, [record])
+    else:
+        labels.append(record)
+
+def _fill_rect(image: np.ndarray, x1: int, y1: int, x2: int, y2: int, color: Tuple[int, int, int]):
+    """Fill a rectangle with slice assignment; corners are inclusive like cv2.rectangle(..., -1)."""
+    image[max(y1, 0):max(y2 + 1, 0), max(x1, 0):max(x2 + 1, 0)] = color
+
+def hex_to_bgr(hex_color: str) -> Tuple[int, int, int]:
+    """Convert an 'RRGGBB' hex string (leading # optional) to a BGR tuple; raises ValueError if malformed."""
+    hex_color = hex_color.lstrip('#')
+    if len(hex_color) != 6:
+        raise ValueError(f"Expected 6 hex digits, got {hex_color!r}")
+    value = int(hex_color, 16)
+    return (value & 0xFF, (value >> 8) & 0xFF, (value >> 16) & 0xFF)
+
+@lru_cache(maxsize=1)
+def _unit_circle(points: int = 64) -> np.ndarray:
+    """Vertices of a unit circle as a (points, 2) float array."""
+    import numpy as np
+    theta = np.linspace(0, 2 * np.pi, points, endpoint=False)
+    return np.stack([np.cos(theta), np.sin(theta)], axis=1)
+
+def _circle_polygon(center: Tuple[int, int], radius: float) -> np.ndarray:
+    """Closed int32 polygon approximating a circle, ready for cv2.polylines."""
+    import numpy as np
+    return np.rint(_unit_circle() * radius + center).astype(np.int32)
+
+# Summary panel layout (white text on a black panel at the bottom-left)
+SUMMARY_FONT_SCALE = 0.6
+SUMMARY_LINE_HEIGHT = 25
+
+@lru_cache(maxsize=32)
+def _render_summary(lines: Tuple[str, ...]) -> Tuple[np.ndarray, int]:
+    """
+    Render the summary lines onto a black panel, once per distinct set of lines
+    
+    Args:
+        lines: Summary text lines
+        
+    Returns:
+        (read-only BGR panel, y of the first line's baseline within the panel)
+    """
+    import cv2
+    import numpy as np
+    
+    font = cv2.FONT_HERSHEY_SIMPLEX
+    sizes = [_text_size(line, font, SUMMARY_FONT_SCALE, 2) for line in lines]
+    max_width = max(width for (width, _), _ in sizes)
+    first_baseline = max(height for (_, height), _ in sizes) + 2
+    bottom = max(baseline for _, baseline in sizes) + 2
+    
+    panel = np.zeros((first_baseline + (len(lines) - 1) * SUMMARY_LINE_HEIGHT + bottom, max_width + 4, 3), np.uint8)
+    for i, line in enumerate(lines):
+        cv2.putText(panel, line, (2, first_baseline + i * SUMMARY_LINE_HEIGHT),
+                    font, SUMMARY_FONT_SCALE, (255, 255, 255), 2)
+    
+    # The panel is shared through the cache, so guard it against in-place edits
+    panel.flags.writeable = False
+    return panel, first_baseline
+
+def _blit(image: np.ndarray, patch: np.ndarray, x: int, y: int):
+    """Copy patch into image with its top-left corner at (x, y), clipped to the image."""
+    image_height, image_width = image.shape[:2]
+    patch_height, patch_width = patch.shape[:2]
+    x1, y1 = max(x, 0), max(y, 0)
+    x2, y2 = min(x + patch_width, image_width), min(y + patch_height, image_height)
+    if x1 < x2 and y1 < y2:
+        image[y1:y2, x1:x2] = patch[y1 - y:y2 - y, x1 - x:x2 - x]
+
+def draw_labels(image: np.ndarray, labels: List[tuple]) -> np.ndarray:
+    """
+    Draw queued labels: every filled background first, then all the text
+    
+    Backgrounds are filled with plain slice assignment (_fill_rect) rather
+    than one cv2.rectangle call each.
+    
+    Args:
+        image: OpenCV image to draw on
+        labels: Records queued by draw_labeled_box/draw_point_with_label/_add_label
+        
+    Returns:
+        Modified image with labels
+    """
+    import cv2
+    
+    # Filled backgrounds
+    for (x1, y1, x2, y2), bg_color, *_ in labels:
+        if bg_color is not None:
+            _fill_rect(image, x1, y1, x2, y2, bg_color)
     
-    # Draw label text
-    cv2.putText(image, label, (label_x, label_y), font, font_scale, (255, 255, 255), thickness)
+    # Text on top
+    font = cv2.FONT_HERSHEY_SIMPLEX
+    for _, _, text, origin, font_scale, text_color, thickness in labels:
+        cv2.putText(image, text, origin, font, font_scale, text_color, thickness)
     
     return image
 
-def visualize_config(config_file: str, output_file: str = "config_visualization.png"):
+def _write_output(output_file: str, encoded: np.ndarray):
+    """Write an encoded image buffer to disk and report the result."""
+    try:
+        with open(output_file, 'wb') as f:
+            f.write(encoded.tobytes())
+        print(f"\nConfiguration visualization saved to: {output_file}")
+    except OSError as e:
+        print(f"Error saving visualization: {e}")
+
+def _config_elements(config: Dict[str, Any]) -> List[tuple]:
+    """
+    Collect the configured points and areas, in screen coordinates
+    
+    This is the one list of positioned elements: visualize_config draws it and
+    check_config bounds-checks it, so both always cover the same things.
+    
+    Args:
+        config: Parsed bot configuration
+        
+    Returns:
+        (kind, name, coords, label, color, radius) records, where kind is "point" or
+        "box", coords is (x1, y1, x2, y2) (a point repeats its x, y) and radius is set
+        for points drawn with a radius circle (the minimap), None otherwise
+    """
+    elements = []
+    
+    health_bar = config.get('health_bar', {})
+    if health_bar.get('x') is not None:
+        x, y = health_bar['x'], health_bar['y']
+        elements.append(("point", "health bar position", (x, y, x, y),
+                         f"Health Bar ({x}, {y}) #{health_bar.get('color', 'Unknown')}",
+                         COLORS.health_bar, None))
+    
+    food_area = config.get('food_area', {})
+    if food_area.get('enabled', False) and food_area.get('coordinates'):
+        x1, y1, x2, y2 = food_area['coordinates']
+        elements.append(("box", "food area", (x1, y1, x2, y2),
+                         f"Food Area ({x1},{y1},{x2},{y2})", COLORS.food_area, None))
+    
+    # Inventory area (for burying)
+    loot = config.get('loot_pickup', {})
+    if loot.get('inventory_area'):
+        x1, y1, x2, y2 = loot['inventory_area']
+        bury_text = " (Bury)" if loot.get('bury', False) else ""
+        elements.append(("box", "inventory area", (x1, y1, x2, y2),
+                         f"Inventory Area{bury_text} ({x1},{y1},{x2},{y2})", COLORS.inventory_area, None))
+    
+    fishing = config.get('fishing', {})
+    if fishing.get('enabled', False):
+        minimap = fishing.get('minimap', {})
+        if minimap.get('center_x') is not None and minimap.get('radius') is not None:
+            x, y = minimap['center_x'], minimap['center_y']
+            elements.append(("point", "minimap center", (x, y, x, y),
+                             f"Minimap Center ({x}, {y})", COLORS.minimap, minimap['radius']))
+        
+        polling = fishing.get('polling_area', {})
+        if polling.get('x') is not None:
+            x, y = polling['x'], polling['y']
+            elements.append(("point", "polling area", (x, y, x, y),
+                             f"Polling Area ({x}, {y}) #{polling['color']}", COLORS.polling, None))
+        
+        for i, drop_box in enumerate(fishing.get('drop_boxes') or []):
+            x1, y1, x2, y2 = drop_box['x1'], drop_box['y1'], drop_box['x2'], drop_box['y2']
+            elements.append(("box", f"drop box {i+1}", (x1, y1, x2, y2),
+                             f"Drop Box {i+1} ({x1},{y1},{x2},{y2}) #{drop_box['color']}", COLORS.polling, None))
+    
+    return elements
+
+def _locate_elements(elements: List[tuple], window_region: Tuple[int, int, int, int]) -> List[Tuple[Tuple[int, int, int, int], bool]]:
+    """
+    Translate elements from _config_elements into window-relative coordinates
+    
+    All elements are stacked into one (N, 4) int32 array, translated with a single
+    subtraction and bounds-checked with one vectorized comparison.
+    
+    Args:
+        elements: Records from _config_elements
+        window_region: (x, y, width, height) of the game window
+        
+    Returns:
+        One (relative coords, inside window) pair per element
+    """
+    import numpy as np
+    
+    if not elements:
+        return []
+    
+    window_x, window_y, window_width, window_height = window_region
+    rel_coords = np.array([coords for _, _, coords, *_ in elements], dtype=np.int32)
+    rel_coords -= (window_x, window_y, window_x, window_y)
+    inside = ((rel_coords >= 0) &
+              (rel_coords < (window_width, window_height, window_width, window_height))).all(axis=1)
+    return list(zip(map(tuple, rel_coords.tolist()), inside.tolist()))
+
+def _outside_warning(kind: str, name: str, rel: Tuple[int, int, int, int]) -> str:
+    """Message for an element that falls outside the window."""
+    if kind == "point":
+        return f"{name.capitalize()} ({rel[0]}, {rel[1]}) is outside window bounds"
+    return f"{name.capitalize()} is outside window bounds"
+
+def check_config(config: Dict[str, Any], window_region: Tuple[int, int, int, int]) -> List[str]:
+    """
+    Check that the configured points and areas fall inside the game window
+    
+    Covers the same elements visualize_config draws, without taking a screenshot.
+    
+    Args:
+        config: Parsed bot configuration
+        window_region: (x, y, width, height) of the game window
+        
+    Returns:
+        One warning per point or area outside the window (empty if everything fits)
+    """
+    elements = _config_elements(config)
+    return [_outside_warning(kind, name, rel)
+            for (kind, name, *_), (rel, inside) in zip(elements, _locate_elements(elements, window_region))
+            if not inside]
+
+def visualize_config(config_file: str, output_file: str = "config_visualization.png",
+                     verbose: bool = True, dry_run: bool = False,
+                     scale: float = 1.0, quiet: bool = False) -> Optional[List[str]]:
     """
     Visualize the bot configuration by taking a screenshot and drawing labeled areas
     
     Args:
         config_file: Path to the configuration JSON file
         output_file: Output image file path
+        verbose: Also report areas that fall outside the window
+        dry_run: Only check the configured positions against the window; no screenshot or image
+        scale: Downscale factor applied to the finished image before saving (e.g. 0.5)
+        quiet: Skip the per-region drawing report (useful when called in a loop)
+        
+    Returns:
+        With dry_run, the list of out-of-bounds warnings (None if the check could not run)
     """
+    import json
+    
     print("=== Configuration Visualization ===")
     
     # Load configuration
     try:
-        with open(config_file, 'r') as f:
-            config = json.load(f)
+        with open(config_file, 'rb') as f:
+            config = json.loads(f.read())
         print(f"Loaded configuration from {config_file}")
     except Exception as e:
         print(f"Error loading configuration: {e}")
@@ -158,113 +503,84 @@ def visualize_config(config_file: str, output_file: str = "config_visualization.
     
     # Find RuneScape window
     print("Finding RuneScape window...")
-    window_region = find_runescape_window()
-    if not window_region:
+    found = _find_window("RuneLite")
+    if not found:
         print("Could not find RuneScape window. Make sure RuneScape is running.")
         return
     
+    hwnd, window_region = found
     window_x, window_y, window_width, window_height = window_region
     print(f"Found RuneScape window at ({window_x}, {window_y}) with size {window_width}x{window_height}")
     
+    if dry_run:
+        warnings = check_config(config, window_region)
+        if warnings:
+            sys.stdout.write("\n".join(warnings) + "\n")
+        else:
+            print("All configured positions are inside the window")
+        return warnings
+    
+    # Only the drawing path needs these
+    import cv2
+    import numpy as np
+    import jake.screenshot_utils
+    
     # Take screenshot
     print("Taking screenshot...")
-    screenshot = jake.screenshot_utils.capture_screen_region(window_region)
+    screenshot = capture_window(hwnd, window_width, window_height)
+    if screenshot is None:
+        screenshot = jake.screenshot_utils.capture_screen_region(window_region)
     if screenshot is None:
         print("Failed to capture screenshot")
         return
+    if screenshot.dtype != np.uint8 or screenshot.ndim != 3 or screenshot.shape[2] not in (3, 4):
+        print(f"Unexpected screenshot format: {screenshot.dtype} {screenshot.shape}")
+        return
     
     # Convert to BGR for OpenCV drawing
-    if len(screenshot.shape) == 3 and screenshot.shape[2] == 3:
-        # Already BGR
-        visualization = screenshot.copy()
-    else:
-        # Convert from RGB to BGR
-        visualization = cv2.cvtColor(screenshot, cv2.COLOR_RGB2BGR)
-    
-    # Define colors for different elements
-    colors = {
-        'health_bar': (0, 255, 0),      # Green
-        'food_area': (0, 165, 255),     # Golden (BGR: 0, 165, 255 = RGB: 255, 165, 0)
-        'inventory_area': (255, 0, 255), # Magenta
-        'loot_area': (255, 0, 0),       # Red
-        'target_area': (0, 0, 255),     # Blue
-        'minimap': (255, 255, 0),       # Cyan
-        'fishing_spot': (0, 255, 255),  # Yellow
-        'bank': (128, 0, 128),          # Purple
-        'polling': (255, 165, 0)        # Orange
-    }
-    
-    # Draw health bar position
-    if config.get('health_bar', {}).get('x') is not None:
-        health_x = config['health_bar']['x']
-        health_y = config['health_bar']['y']
-        health_color = config['health_bar'].get('color', 'Unknown')
-        
-        # Convert to window-relative coordinates
-        rel_x = health_x - window_x
-        rel_y = health_y - window_y
-        
-        if 0 <= rel_x < window_width and 0 <= rel_y < window_height:
-            visualization = draw_point_with_label(
-                visualization, (rel_x, rel_y), 
-                f"Health Bar ({health_x}, {health_y}) #{health_color}", 
-                colors['health_bar']
-            )
-            print(f"Drew health bar at ({rel_x}, {rel_y})")
-        else:
-            print(f"Health bar position ({rel_x}, {rel_y}) is outside window bounds")
-    
-    # Draw food area
-    if config.get('food_area', {}).get('enabled', False) and config['food_area'].get('coordinates'):
-        food_coords = config['food_area']['coordinates']
-        x1, y1, x2, y2 = food_coords
-        
-        # Convert to window-relative coordinates
-        rel_x1 = x1 - window_x
-        rel_y1 = y1 - window_y
-        rel_x2 = x2 - window_x
-        rel_y2 = y2 - window_y
-        
-        # Check if area is within window bounds
-        if (0 <= rel_x1 < window_width and 0 <= rel_y1 < window_height and 
-            0 <= rel_x2 < window_width and 0 <= rel_y2 < window_height):
-            visualization = draw_labeled_box(
-                visualization, (rel_x1, rel_y1, rel_x2, rel_y2),
-                f"Food Area ({x1},{y1},{x2},{y2})", 
-                colors['food_area']
-            )
-            print(f"Drew food area: ({rel_x1}, {rel_y1}) to ({rel_x2}, {rel_y2})")
+    if screenshot.shape[2] == 3:
+        # Already BGR; draw on it directly when we own a contiguous buffer (both capture
+        # paths return one), and only fall back to a private copy for views
+        if screenshot.flags['C_CONTIGUOUS'] and screenshot.base is None:
+            visualization = screenshot
         else:
-            print(f"Food area is outside window bounds")
-    
-    # Draw inventory area (for burying)
-    if config.get('loot_pickup', {}).get('inventory_area'):
-        inv_coords = config['loot_pickup']['inventory_area']
-        x1, y1, x2, y2 = inv_coords
-        
-        # Convert to window-relative coordinates
-        rel_x1 = x1 - window_x
-        rel_y1 = y1 - window_y
-        rel_x2 = x2 - window_x
-        rel_y2 = y2 - window_y
-        
-        # Check if area is within window bounds
-        if (0 <= rel_x1 < window_width and 0 <= rel_y1 < window_height and 
-            0 <= rel_x2 < window_width and 0 <= rel_y2 < window_height):
-            bury_text = " (Bury)" if config['loot_pickup'].get('bury', False) else ""
-            visualization = draw_labeled_box(
-                visualization, (rel_x1, rel_y1, rel_x2, rel_y2),
-                f"Inventory Area{bury_text} ({x1},{y1},{x2},{y2})", 
-                colors['inventory_area']
-            )
-            print(f"Drew inventory area: ({rel_x1}, {rel_y1}) to ({rel_x2}, {rel_y2})")
-        else:
-            print(f"Inventory area is outside window bounds")
+            visualization = np.array(screenshot, order='C')
+    else:
+        # Convert from RGB(A) to BGR with a channel-reversing slice (one contiguous copy)
+        visualization = np.ascontiguousarray(screenshot[..., 2::-1])
+    
+    # Labels are queued while drawing and rendered together at the end; the
+    # per-region log lines are likewise collected and printed in one write.
+    # Log lines are kept as (format, args) and only formatted when printed,
+    # so a quiet run never builds the strings.
+    labels = []
+    log_msgs = []
+    
+    def log(fmt, *args):
+        if not quiet:
+            log_msgs.append((fmt, args))
+    
+    # Radius circles are queued as polygons per color and drawn with one polylines call each
+    circles = {}
+    
+    # Hoist the config sections used below so each is looked up only once
+    loot = config.get('loot_pickup', {})
+    fishing = config.get('fishing', {})
+    
+    # Parse the fishing swatch colors once; None marks a malformed value
+    swatch_colors = {}
+    for key in ('fishing_spot_color', 'bank_color'):
+        hex_color = fishing.get(key)
+        if hex_color:
+            try:
+                swatch_colors[key] = hex_to_bgr(hex_color)
+            except ValueError:
+                swatch_colors[key] = None
     
     # Draw loot pickup area (center + max_distance circle)
-    if config.get('loot_pickup', {}).get('enabled', False):
-        max_distance = config['loot_pickup'].get('max_distance', 500)
-        loot_color = config['loot_pickup'].get('loot_color', 'Unknown')
+    if loot.get('enabled', False):
+        max_distance = loot.get('max_distance', 500)
+        loot_color = loot.get('loot_color', 'Unknown')
         
         # Calculate center of window
         center_x = window_width // 2
@@ -274,262 +590,139 @@ def visualize_config(config_file: str, output_file: str = "config_visualization.
         visualization = draw_point_with_label(
             visualization, (center_x, center_y),
             f"Loot Center ({window_x + center_x}, {window_y + center_y})", 
-            colors['loot_area']
+            COLORS.loot_area, labels=labels
         )
         
-        # Draw loot pickup radius circle
-        cv2.circle(visualization, (center_x, center_y), max_distance, colors['loot_area'], 2)
+        # Queue loot pickup radius circle
+        circles.setdefault(COLORS.loot_area, []).append(_circle_polygon((center_x, center_y), max_distance))
         
         # Add radius label
-        font = cv2.FONT_HERSHEY_SIMPLEX
-        font_scale = 0.5
         radius_label = f"Loot Radius: {max_distance}px (#{loot_color})"
-        (text_width, text_height), baseline = cv2.getTextSize(radius_label, font, font_scale, 2)
+        (text_width, text_height), baseline = _text_size(radius_label, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 2)
         
         # Position label at top of circle
         label_x = center_x - text_width // 2
         label_y = center_y - max_distance - 10
         
         if label_y >= text_height + 5:  # Ensure label is visible
-            # Draw label background
-            cv2.rectangle(visualization, 
-                          (label_x - 2, label_y - text_height - 2),
-                          (label_x + text_width + 2, label_y + baseline + 2),
-                          colors['loot_area'], -1)
-            
-            # Draw label text
-            cv2.putText(visualization, radius_label, (label_x, label_y), 
-                       font, font_scale, (255, 255, 255), 2)
-        
-        print(f"Drew loot pickup area: center ({center_x}, {center_y}), radius {max_distance}")
-    
-    # Draw fishing configuration
-    if config.get('fishing', {}).get('enabled', False):
-        fishing_config = config['fishing']
-        minimap_config = fishing_config.get('minimap', {})
-        
-        # Draw minimap circle
-        if minimap_config.get('center_x') is not None and minimap_config.get('radius') is not None:
-            center_x = minimap_config['center_x']
-            center_y = minimap_config['center_y']
-            radius = minimap_config['radius']
-            
-            # Convert to window-relative coordinates
-            rel_center_x = center_x - window_x
-            rel_center_y = center_y - window_y
-            
-            if (0 <= rel_center_x < window_width and 0 <= rel_center_y < window_height):
-                # Draw minimap center point
-                visualization = draw_point_with_label(
-                    visualization, (rel_center_x, rel_center_y),
-                    f"Minimap Center ({center_x}, {center_y})", 
-                    colors['minimap']
-                )
-                
-                # Draw minimap circle
-                cv2.circle(visualization, (rel_center_x, rel_center_y), int(radius), colors['minimap'], 2)
-                
-                # Add radius label
-                font = cv2.FONT_HERSHEY_SIMPLEX
-                font_scale = 0.5
-                radius_label = f"Minimap Radius: {radius:.1f}px"
-                (text_width, text_height), baseline = cv2.getTextSize(radius_label, font, font_scale, 2)
-                
-                # Position label at top of circle
-                label_x = rel_center_x - text_width // 2
-                label_y = rel_center_y - int(radius) - 10
-                
-                if label_y >= text_height + 5:  # Ensure label is visible
-                    # Draw label background
-                    cv2.rectangle(visualization, 
-                                  (label_x - 2, label_y - text_height - 2),
-                                  (label_x + text_width + 2, label_y + baseline + 2),
-                                  colors['minimap'], -1)
-                    
-                    # Draw label text
-                    cv2.putText(visualization, radius_label, (label_x, label_y), 
-                               font, font_scale, (255, 255, 255), 2)
-                
-                print(f"Drew minimap: center ({rel_center_x}, {rel_center_y}), radius {radius:.1f}")
-            else:
-                print(f"Minimap center ({rel_center_x}, {rel_center_y}) is outside window bounds")
-        
-        # Draw fishing spot color indicator (if configured)
-        if fishing_config.get('fishing_spot_color'):
-            # Draw a small colored rectangle to show the fishing spot color
-            color_rect_x = 10
-            color_rect_y = window_height - 80
-            color_rect_size = 20
-            
-            # Convert hex color to BGR
-            hex_color = fishing_config['fishing_spot_color']
-            try:
-                # Remove # if present
-                if hex_color.startswith('#'):
-                    hex_color = hex_color[1:]
-                
-                # Convert hex to RGB then to BGR
-                r = int(hex_color[0:2], 16)
-                g = int(hex_color[2:4], 16)
-                b = int(hex_color[4:6], 16)
-                bgr_color = (b, g, r)
-                
-                # Draw color rectangle
-                cv2.rectangle(visualization, 
-                              (color_rect_x, color_rect_y),
-                              (color_rect_x + color_rect_size, color_rect_y + color_rect_size),
-                              bgr_color, -1)
-                
-                # Draw border
-                cv2.rectangle(visualization, 
-                              (color_rect_x, color_rect_y),
-                              (color_rect_x + color_rect_size, color_rect_y + color_rect_size),
-                              colors['fishing_spot'], 2)
-                
-                # Add label
-                font = cv2.FONT_HERSHEY_SIMPLEX
-                font_scale = 0.5
-                label = f"Fishing Spot: #{fishing_config['fishing_spot_color']}"
-                cv2.putText(visualization, label, (color_rect_x + color_rect_size + 5, color_rect_y + 15), 
-                           font, font_scale, colors['fishing_spot'], 2)
-                
-                print(f"Drew fishing spot color indicator: #{fishing_config['fishing_spot_color']}")
-            except (ValueError, IndexError):
-                print(f"Invalid fishing spot color format: {fishing_config['fishing_spot_color']}")
-        
-        # Draw bank color indicator (if configured)
-        if fishing_config.get('bank_color'):
-            # Draw a small colored rectangle to show the bank color
-            color_rect_x = 10
-            color_rect_y = window_height - 50
-            color_rect_size = 20
-            
-            # Convert hex color to BGR
-            hex_color = fishing_config['bank_color']
-            try:
-                # Remove # if present
-                if hex_color.startswith('#'):
-                    hex_color = hex_color[1:]
-                
-                # Convert hex to RGB then to BGR
-                r = int(hex_color[0:2], 16)
-                g = int(hex_color[2:4], 16)
-                b = int(hex_color[4:6], 16)
-                bgr_color = (b, g, r)
-                
-                # Draw color rectangle
-                cv2.rectangle(visualization, 
-                              (color_rect_x, color_rect_y),
-                              (color_rect_x + color_rect_size, color_rect_y + color_rect_size),
-                              bgr_color, -1)
-                
-                # Draw border
-                cv2.rectangle(visualization, 
-                              (color_rect_x, color_rect_y),
-                              (color_rect_x + color_rect_size, color_rect_y + color_rect_size),
-                              colors['bank'], 2)
-                
-                # Add label
-                font = cv2.FONT_HERSHEY_SIMPLEX
-                font_scale = 0.5
-                label = f"Bank: #{fishing_config['bank_color']}"
-                cv2.putText(visualization, label, (color_rect_x + color_rect_size + 5, color_rect_y + 15), 
-                           font, font_scale, colors['bank'], 2)
-                
-                print(f"Drew bank color indicator: #{fishing_config['bank_color']}")
-            except (ValueError, IndexError):
-                print(f"Invalid bank color format: {fishing_config['bank_color']}")
-        
-        # Draw polling area (if configured)
-        if fishing_config.get('polling_area', {}).get('x') is not None:
-            polling_x = fishing_config['polling_area']['x']
-            polling_y = fishing_config['polling_area']['y']
-            polling_color = fishing_config['polling_area']['color']
-            
-            # Convert to window-relative coordinates
-            rel_polling_x = polling_x - window_x
-            rel_polling_y = polling_y - window_y
+            _add_label(visualization, labels, radius_label, (label_x, label_y), 0.5, 2,
+                       (text_width, text_height), baseline, COLORS.loot_area)
+        
+        log("Drew loot pickup area: center (%s, %s), radius %s", center_x, center_y, max_distance)
+    
+    # Draw the fishing spot and bank color indicators (if configured) as small swatches
+    if fishing.get('enabled', False):
+        for key, name, color_rect_y, border_color in (
+            ('fishing_spot_color', "Fishing Spot", window_height - 80, COLORS.fishing_spot),
+            ('bank_color', "Bank", window_height - 50, COLORS.bank),
+        ):
+            if key not in swatch_colors:
+                continue
+            if swatch_colors[key] is None:
+                log("Invalid %s color format: %s", name.lower(), fishing[key])
+                continue
             
-            if (0 <= rel_polling_x < window_width and 0 <= rel_polling_y < window_height):
-                # Draw polling point
-                visualization = draw_point_with_label(
-                    visualization, (rel_polling_x, rel_polling_y),
-                    f"Polling Area ({polling_x}, {polling_y}) #{polling_color}", 
-                    colors['polling']
-                )
-                print(f"Drew polling area: ({rel_polling_x}, {rel_polling_y})")
-            else:
-                print(f"Polling area ({rel_polling_x}, {rel_polling_y}) is outside window bounds")
-        
-        # Draw drop boxes (if configured)
-        if fishing_config.get('drop_boxes'):
-            for i, drop_box in enumerate(fishing_config['drop_boxes']):
-                x1 = drop_box['x1']
-                y1 = drop_box['y1']
-                x2 = drop_box['x2']
-                y2 = drop_box['y2']
-                drop_color = drop_box['color']
-                
-                # Convert to window-relative coordinates
-                rel_x1 = x1 - window_x
-                rel_y1 = y1 - window_y
-                rel_x2 = x2 - window_x
-                rel_y2 = y2 - window_y
-                
-                if (0 <= rel_x1 < window_width and 0 <= rel_y1 < window_height and 
-                    0 <= rel_x2 < window_width and 0 <= rel_y2 < window_height):
-                    # Draw drop box rectangle
-                    visualization = draw_labeled_box(
-                        visualization, (rel_x1, rel_y1, rel_x2, rel_y2),
-                        f"Drop Box {i+1} ({x1},{y1},{x2},{y2}) #{drop_color}", 
-                        colors['polling']
-                    )
-                    print(f"Drew drop box {i+1}: ({rel_x1}, {rel_y1}) to ({rel_x2}, {rel_y2})")
-                else:
-                    print(f"Drop box {i+1} is outside window bounds")
+            draw_color_indicator(visualization, f"{name}: #{fishing[key]}", swatch_colors[key],
+                                 border_color, color_rect_y, labels=labels)
+            log("Drew %s color indicator: #%s", name.lower(), fishing[key])
+    
+    # Draw the configured points; in-bounds boxes are collected and drawn together below
+    elements = _config_elements(config)
+    boxes = []
+    for (kind, name, _, label, color, radius), (rel, inside) in zip(elements, _locate_elements(elements, window_region)):
+        if not inside:
+            if verbose and not quiet:
+                log("%s", _outside_warning(kind, name, rel))
+            continue
+        
+        if kind == "box":
+            boxes.append((name, rel, label, color))
+            continue
+        
+        rel_x, rel_y = rel[:2]
+        visualization = draw_point_with_label(visualization, (rel_x, rel_y), label, color, labels=labels)
+        if radius is None:
+            log("Drew %s at (%s, %s)", name, rel_x, rel_y)
+            continue
+        
+        # Queue the radius circle
+        circles.setdefault(color, []).append(_circle_polygon((rel_x, rel_y), int(radius)))
+        
+        # Add radius label, positioned at the top of the circle
+        radius_label = f"Minimap Radius: {radius:.1f}px"
+        (text_width, text_height), baseline = _text_size(radius_label, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 2)
+        label_x = rel_x - text_width // 2
+        label_y = rel_y - int(radius) - 10
+        
+        if label_y >= text_height + 5:  # Ensure label is visible
+            _add_label(visualization, labels, radius_label, (label_x, label_y), 0.5, 2,
+                       (text_width, text_height), baseline, color)
+        
+        log("Drew %s: center (%s, %s), radius %.1f", name, rel_x, rel_y, radius)
+    
+    if boxes:
+        rel_coords = np.array([rel for _, rel, _, _ in boxes], dtype=np.int32)
+        
+        # Outline each box as a closed 4-point contour, same corners as cv2.rectangle
+        contours = rel_coords[:, [0, 1, 2, 1, 2, 3, 0, 3]].reshape(-1, 4, 2)
+        
+        # Labels sit above their box, clamped so they stay visible (see draw_labeled_box)
+        sizes = [_text_size(label, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2) for _, _, label, _ in boxes]
+        text_heights = np.array([h for (_, h), _ in sizes], dtype=np.int32)
+        label_ys = np.maximum(rel_coords[:, 1] - 10, text_heights + 5).tolist()
+        
+        # One drawContours call per color rasterizes every box of that color (e.g. all drop boxes)
+        contours_by_color = {}
+        for (name, rel, label, color), contour, size, label_y in zip(boxes, contours, sizes, label_ys):
+            contours_by_color.setdefault(color, []).append(contour)
+            (text_width, text_height), baseline = size
+            _add_label(visualization, labels, label, (rel[0], label_y), 0.6, 2,
+                       (text_width, text_height), baseline, color)
+            log("Drew %s: (%s, %s) to (%s, %s)", name, *rel)
+        for color, group in contours_by_color.items():
+            cv2.drawContours(visualization, group, -1, color, 2)
     
     # Add configuration summary text
-    summary_lines = [
-        "Configuration Summary:",
-        f"Human Movement: {'Enabled' if config.get('human_movement', {}).get('enabled', False) else 'Disabled'}",
-        f"Auto-eating: {'Enabled' if config.get('food_area', {}).get('enabled', False) else 'Disabled'}",
-        f"Loot Pickup: {'Enabled' if config.get('loot_pickup', {}).get('enabled', False) else 'Disabled'}",
-        f"Fishing Bot: {'Enabled' if config.get('fishing', {}).get('enabled', False) else 'Disabled'}",
-        f"Target Color: #{config.get('combat', {}).get('default_target_color', 'Unknown')}",
-        f"Pixel Method: {config.get('combat', {}).get('pixel_method', 'Unknown')}"
-    ]
+    summary_lines = ["Configuration Summary:"]
+    summary_lines.extend(_summary_line(config, *field) for field in SUMMARY_FIELDS)
     
     # Add fishing-specific summary if enabled
-    if config.get('fishing', {}).get('enabled', False):
-        fishing_config = config['fishing']
-        summary_lines.extend([
-            f"Travel Delay: {fishing_config.get('travel_delay', 'Unknown')}s",
-            f"Fishing Delay: {fishing_config.get('fishing_delay', 'Unknown')}s"
-        ])
-    
-    # Draw summary text at bottom-left
-    font = cv2.FONT_HERSHEY_SIMPLEX
-    font_scale = 0.6
-    line_height = 25
-    y_offset = window_height - (len(summary_lines) * line_height) - 30  # Start from bottom
+    if fishing.get('enabled', False):
+        summary_lines.extend(_summary_line(config, *field) for field in FISHING_SUMMARY_FIELDS)
     
-    for i, line in enumerate(summary_lines):
-        y = y_offset + i * line_height
-        
-        # Draw text background
-        (text_width, text_height), baseline = cv2.getTextSize(line, font, font_scale, 2)
-        cv2.rectangle(visualization, 
-                      (10 - 2, y - text_height - 2),
-                      (10 + text_width + 2, y + baseline + 2),
-                      (0, 0, 0), -1)  # Black background
-        
-        # Draw text
-        cv2.putText(visualization, line, (10, y), font, font_scale, (255, 255, 255), 2)
+    for color, polygons in circles.items():
+        cv2.polylines(visualization, polygons, True, color, 2)
+    draw_labels(visualization, labels)
+    if log_msgs:
+        sys.stdout.write("".join(fmt % args + "\n" for fmt, args in log_msgs))
+    
+    # Draw summary text at bottom-left from a pre-rendered panel
+    panel, first_baseline = _render_summary(tuple(summary_lines))
+    y_offset = window_height - (len(summary_lines) * SUMMARY_LINE_HEIGHT) - 30  # Start from bottom
+    _blit(visualization, panel, 8, y_offset - first_baseline)
     
     # Save the visualization
     try:
-        cv2.imwrite(output_file, visualization)
-        print(f"\nConfiguration visualization saved to: {output_file}")
+        # Favor encode speed: light PNG compression, or quality 90 for JPEG outputs
+        ext = os.path.splitext(output_file)[1].lower()
+        if ext in ('.jpg', '.jpeg'):
+            params = [cv2.IMWRITE_JPEG_QUALITY, 90]
+        elif ext == '.png':
+            params = [cv2.IMWRITE_PNG_COMPRESSION, 1]
+        else:
+            params = []
+        
+        # Downscale last so everything is drawn at full resolution; fewer pixels to encode
+        if scale < 1.0:
+            visualization = cv2.resize(visualization, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        
+        ok, encoded = cv2.imencode(ext, visualization, params)
+        if not ok:
+            raise ValueError(f"Could not encode image as '{ext}'")
+        
+        # Encoding stays on this thread; the disk write runs in the background so the
+        # summary below prints right away (non-daemon, so the process waits for it)
+        threading.Thread(target=_write_output, args=(output_file, encoded)).start()
         print(f"Window region: ({window_x}, {window_y}, {window_width}, {window_height})")
         
         # Show legend
@@ -549,18 +742,28 @@ def visualize_config(config_file: str, output_file: str = "config_visualization.
 
 def main():
     """Main function to run the visualization script."""
-    if len(sys.argv) < 2:
-        print("Usage: python visualize_config.py <config_file> [output_file]")
+    args = sys.argv[1:]
+    check_only = "--check" in args
+    args = [arg for arg in args if arg != "--check"]
+    
+    if not args:
+        print("Usage: python visualize_config.py [--check] <config_file> [output_file]")
         print("Example: python visualize_config.py bot_config.json config_viz.png")
+        print("The output format follows the file extension (.png, or .jpg for a faster save)")
+        print("--check only validates positions against the window (exit code 1 on problems)")
         return
     
-    config_file = sys.argv[1]
-    output_file = sys.argv[2] if len(sys.argv) > 2 else "config_visualization.png"
+    config_file = args[0]
+    output_file = args[1] if len(args) > 1 else "config_visualization.png"
     
     if not os.path.exists(config_file):
         print(f"Configuration file not found: {config_file}")
         return
     
+    if check_only:
+        warnings = visualize_config(config_file, dry_run=True)
+        sys.exit(0 if warnings == [] else 1)
+    
     visualize_config(config_file, output_file)
 
 if __name__ == "__main__":
@@ -6,6 +6,13 @@ from PIL import Image, ImageGrab
 from typing import Tuple, Optional, List
 import jake.color_utils
 
+# pywin32 is only available on Windows; window lookup needs it
+try:
+    import win32gui
+    _HAS_WIN32 = True
+except ImportError:
+    _HAS_WIN32 = False
+
 def capture_screen_region(region: Tuple[int, int, int, int]) -> np.ndarray:
     """
     Capture a specific region of the screen
@@ -14,11 +21,12 @@ def capture_screen_region(region: Tuple[int, int, int, int]) -> np.ndarray:
         region: (x, y, width, height) coordinates
         
     Returns:
-        OpenCV image array in BGR format
+        OpenCV image array in BGR format (newly allocated; the caller owns it)
     """
     x, y, w, h = region
     screenshot = ImageGrab.grab(bbox=(x, y, x + w, y + h))
-    return cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
+    # asarray wraps the PIL buffer without another copy; cvtColor allocates the result
+    return cv2.cvtColor(np.asarray(screenshot), cv2.COLOR_RGB2BGR)
 
 def capture_left_half_screen() -> np.ndarray:
     """
@@ -144,15 +152,12 @@ def get_pixel_color_at_position(x: int, y: int) -> Tuple[int, int, int]:
         RGB color tuple
     """
     try:
-        # Capture a small region around the pixel
-        region = (x, y, 1, 1)
-        screenshot = capture_screen_region(region)
+        # Grab just the 1x1 region and read it straight from the PIL image,
+        # skipping the numpy/OpenCV BGR round-trip of capture_screen_region
+        screenshot = ImageGrab.grab(bbox=(x, y, x + 1, y + 1))
+        r, g, b = screenshot.getpixel((0, 0))[:3]
         
-        # Get the pixel color (OpenCV uses BGR, so convert to RGB)
-        bgr_color = screenshot[0, 0]
-        rgb_color = (bgr_color[2], bgr_color[1], bgr_color[0])  # BGR to RGB
-        
-        return rgb_color
+        return (r, g, b)
         
     except Exception as e:
         print(f"Error getting pixel color: {e}")
@@ -168,33 +173,92 @@ def find_runescape_window(window_title: str = "RuneLite") -> Tuple[int, int, int
     Returns:
         Tuple of (x, y, width, height) coordinates or None if not found
     """
-    try:
-        # Try to find window by title
-        import win32gui
-        import win32con
-        
-        def enum_windows_callback(hwnd, windows):
-            if win32gui.IsWindowVisible(hwnd):
-                window_title_text = win32gui.GetWindowText(hwnd)
-                if window_title.lower() in window_title_text.lower():
-                    rect = win32gui.GetWindowRect(hwnd)
-                    x, y, w, h = rect[0], rect[1], rect[2] - rect[0], rect[3] - rect[1]
-                    windows.append((x, y, w, h))
-            return True
-        
-        windows = []
-        win32gui.EnumWindows(enum_windows_callback, windows)
+    return find_window_handle(window_title)[1]
+
+def find_window_handle(window_title: str = "RuneLite") -> Tuple[int, Tuple[int, int, int, int]]:
+    """
+    Find a visible window whose title contains window_title
+    
+    An exact title match is tried first with FindWindow, which is a single
+    lookup; only if that misses are all top-level windows enumerated.
+    
+    Args:
+        window_title: Title (or part of the title) of the window to search for
         
-        if windows:
-            return windows[0]  # Return the first matching window
+    Returns:
+        Tuple of (hwnd, (x, y, width, height))
+    """
+    if not _HAS_WIN32:
+        raise ImportError("win32gui not available. Please install pywin32: pip install pywin32")
+    
+    try:
+        def window_rect(hwnd):
+            rect = win32gui.GetWindowRect(hwnd)
+            return (rect[0], rect[1], rect[2] - rect[0], rect[3] - rect[1])
+        
+        # Fast path: exact title match. pywin32 raises rather than returning 0 when no
+        # window has exactly this title (e.g. a logged-in "RuneLite - name" client)
+        try:
+            hwnd = win32gui.FindWindow(None, window_title)
+        except win32gui.error:
+            hwnd = 0
+        if hwnd and win32gui.IsWindowVisible(hwnd):
+            return hwnd, window_rect(hwnd)
+        
+        # Slow path: substring match (e.g. "RuneLite - username"), first over the known
+        # game window classes with FindWindowEx, then over every top-level window
+        title_lower = window_title.lower()
+        hwnd = _find_window_by_class(title_lower) or _enum_find_window(title_lower)
+        
+        if hwnd:
+            return hwnd, window_rect(hwnd)
         else:
             raise ValueError(f"Could not find window with title containing '{window_title}'")
             
-    except ImportError:
-        raise ImportError("win32gui not available. Please install pywin32: pip install pywin32")
     except Exception as e:
         raise Exception(f"Error finding window: {e}")
 
+# Window classes of the game clients (RuneLite is a Java AWT frame). FindWindowEx
+# walks just the windows of one class, so these are searched before the full scan.
+_GAME_WINDOW_CLASSES = ("SunAwtFrame", "LWJGL", "GLFW30")
+
+def _find_window_by_class(title_lower: str) -> Optional[int]:
+    """Return the first visible game-class window whose title contains title_lower."""
+    for window_class in _GAME_WINDOW_CLASSES:
+        # pywin32 raises when there is no (further) window of the class, so an
+        # error just ends the walk over this class
+        try:
+            hwnd = win32gui.FindWindowEx(None, None, window_class, None)
+            while hwnd:
+                if win32gui.IsWindowVisible(hwnd) and title_lower in win32gui.GetWindowText(hwnd).lower():
+                    return hwnd
+                hwnd = win32gui.FindWindowEx(None, hwnd, window_class, None)
+        except win32gui.error:
+            continue
+    return None
+
+class _WindowFound(Exception):
+    """Raised from an EnumWindows callback to stop enumerating at the first match."""
+
+def _enum_find_window(title_lower: str) -> Optional[int]:
+    """Return the first visible window whose title contains title_lower."""
+    found = []
+    
+    def enum_windows_callback(hwnd, _):
+        if not win32gui.IsWindowVisible(hwnd):
+            return True
+        if title_lower in win32gui.GetWindowText(hwnd).lower():
+            found.append(hwnd)
+            raise _WindowFound
+        return True
+    
+    try:
+        win32gui.EnumWindows(enum_windows_callback, None)
+    except _WindowFound:
+        pass
+    
+    return found[0] if found else None
+
 def save_debug_screenshot(region: Tuple[int, int, int, int],
                          action: str,
                          screenshot_dir: str = "debug_screenshots",
@@ -0,0 +1,61 @@
+"""
+Helpers shared by the interactive configuration scripts in jake/examples.
+"""
+
+import math
+import os
+import sys
+import time
+from functools import lru_cache
+from typing import Optional
+
+@lru_cache(maxsize=1)
+def _env_countdown() -> Optional[int]:
+    """JAKE_COUNTDOWN as whole seconds, parsed once; None if unset or invalid."""
+    value = os.environ.get("JAKE_COUNTDOWN")
+    if value is None:
+        return None
+    try:
+        seconds = int(value)
+    except ValueError:
+        seconds = -1
+    if seconds < 0:
+        print(f"Ignoring invalid JAKE_COUNTDOWN={value!r}; using the default countdown")
+        return None
+    return seconds
+
+def countdown_seconds(default: int) -> int:
+    """
+    Length of the mouse-positioning countdown
+    
+    JAKE_COUNTDOWN overrides the default, e.g. 0 to skip the wait when scripting
+    the setup. A value that is not a whole number of seconds is ignored with a
+    warning instead of aborting the setup.
+    
+    Args:
+        default: Countdown used when JAKE_COUNTDOWN is unset or invalid
+    
+    Returns:
+        Countdown in whole seconds
+    """
+    seconds = _env_countdown()
+    return default if seconds is None else seconds
+
+def run_countdown(seconds: float):
+    """
+    Print a "3... 2... 1..." countdown and return once it has elapsed
+    
+    Args:
+        seconds: Length of the countdown
+    """
+    # Sleep against a fixed deadline so print latency doesn't stretch the wait
+    deadline = time.monotonic() + seconds
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        whole = math.ceil(remaining)
+        sys.stdout.write(f"{whole}... ")
+        sys.stdout.flush()
+        time.sleep(min(1.0, remaining - (whole - 1)))
+    sys.stdout.write("\n")
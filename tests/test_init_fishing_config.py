@@ -0,0 +1,27 @@
+"""
+Tests for the drop box grid generated by jake/examples/init_fishing_config.py.
+"""
+
+import os
+import sys
+
+# The examples are scripts rather than a package; load the module from its folder
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "jake", "examples"))
+import init_fishing_config
+
+def test_grid_fills_the_remaining_slots_row_by_row():
+    boxes = init_fishing_config._grid_drop_boxes(1000, 500, 30, 20, 42, 36)
+
+    assert len(boxes) == 15
+    assert boxes[0] == {"x1": 1042, "y1": 500, "x2": 1072, "y2": 520, "color": None}
+    # Slot 5 starts the second row, under the first box
+    assert boxes[3] == {"x1": 1000, "y1": 536, "x2": 1030, "y2": 556, "color": None}
+    # Last slot: fourth column, fourth row
+    assert boxes[-1] == {"x1": 1126, "y1": 608, "x2": 1156, "y2": 628, "color": None}
+
+def test_grid_follows_the_measured_pitch_and_box_size():
+    # A scaled-up client: bigger slots and pitch than the default layout
+    boxes = init_fishing_config._grid_drop_boxes(10, 20, 45, 30, 63, 54)
+
+    assert [(box["x1"], box["y1"]) for box in boxes[:4]] == [(73, 20), (136, 20), (199, 20), (10, 74)]
+    assert all(box["x2"] - box["x1"] == 45 and box["y2"] - box["y1"] == 30 for box in boxes)
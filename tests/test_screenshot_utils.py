@@ -0,0 +1,93 @@
+"""
+Tests for the window lookup in jake.screenshot_utils, with win32gui faked out.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+screenshot_utils = pytest.importorskip("jake.screenshot_utils")
+
+class _Win32Error(Exception):
+    """Stands in for pywintypes.error."""
+
+def _fake_win32gui(windows, find_window=None, find_window_ex=None):
+    """
+    Build a fake win32gui over a {hwnd: title} table of visible windows
+
+    find_window/find_window_ex replace FindWindow/FindWindowEx; by default
+    FindWindow raises like pywin32 does on a miss and FindWindowEx finds nothing.
+    """
+    def raise_not_found(*args):
+        raise _Win32Error("Cannot find window")
+
+    def enum_windows(callback, extra):
+        for hwnd in windows:
+            if not callback(hwnd, extra):
+                break
+
+    return SimpleNamespace(
+        error=_Win32Error,
+        FindWindow=find_window or raise_not_found,
+        FindWindowEx=find_window_ex or (lambda *args: 0),
+        EnumWindows=enum_windows,
+        IsWindowVisible=lambda hwnd: hwnd in windows,
+        GetWindowText=lambda hwnd: windows.get(hwnd, ""),
+        GetWindowRect=lambda hwnd: (10, 20, 810, 620),
+    )
+
+@pytest.fixture
+def fake_win32(monkeypatch):
+    """Install a fake win32gui built with _fake_win32gui's arguments."""
+    def install(*args, **kwargs):
+        fake = _fake_win32gui(*args, **kwargs)
+        monkeypatch.setattr(screenshot_utils, "win32gui", fake, raising=False)
+        monkeypatch.setattr(screenshot_utils, "_HAS_WIN32", True)
+        return fake
+    return install
+
+def test_exact_title_miss_falls_back_to_enumeration(fake_win32):
+    # Logged-in clients are titled "RuneLite - <name>", so FindWindow raises
+    fake_win32({7: "Notepad", 42: "RuneLite - jake"})
+
+    hwnd, region = screenshot_utils.find_window_handle("RuneLite")
+
+    assert hwnd == 42
+    assert region == (10, 20, 800, 600)
+
+def test_exact_title_match_is_used_directly(fake_win32):
+    fake_win32({5: "RuneLite"}, find_window=lambda cls, title: 5)
+
+    assert screenshot_utils.find_window_handle("RuneLite")[0] == 5
+
+def test_no_matching_window_raises(fake_win32):
+    fake_win32({7: "Notepad"})
+
+    with pytest.raises(Exception, match="Could not find window"):
+        screenshot_utils.find_window_handle("RuneLite")
+
+def _find_window_ex_over(windows, classes):
+    """FindWindowEx over {hwnd: class}, raising like pywin32 when a class has no (further) window."""
+    def find_window_ex(parent, after, window_class, title):
+        hwnds = [hwnd for hwnd in windows if classes.get(hwnd) == window_class]
+        rest = hwnds[hwnds.index(after) + 1:] if after in hwnds else hwnds
+        if not rest:
+            raise _Win32Error("Cannot find window")
+        return rest[0]
+    return find_window_ex
+
+def test_class_search_skips_classes_without_windows(fake_win32):
+    # No SunAwtFrame windows at all: the walk moves on to the next class
+    windows = {3: "RuneLite launcher", 9: "RuneLite - jake"}
+    classes = {3: "LWJGL", 9: "GLFW30"}
+    fake_win32(windows, find_window_ex=_find_window_ex_over(windows, classes))
+
+    assert screenshot_utils._find_window_by_class("runelite - ") == 9
+
+def test_class_search_miss_falls_back_to_enumeration(fake_win32):
+    # Walking past the last window of each class raises; EnumWindows still runs
+    windows = {3: "Some Java app", 11: "RuneLite - jake"}
+    classes = {3: "SunAwtFrame"}
+    fake_win32(windows, find_window_ex=_find_window_ex_over(windows, classes))
+
+    assert screenshot_utils.find_window_handle("RuneLite")[0] == 11
@@ -0,0 +1,66 @@
+"""
+Tests for the window bounds checks in jake/examples/visualize_config.py.
+"""
+
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("numpy")
+
+# The examples are scripts rather than a package; load the module from its folder
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "jake", "examples"))
+import visualize_config
+
+WINDOW = (100, 50, 800, 600)
+
+CONFIG = {
+    "health_bar": {"x": 150, "y": 80, "color": "FF0000"},
+    "food_area": {"enabled": True, "coordinates": [200, 100, 260, 160]},
+    "loot_pickup": {"inventory_area": [850, 500, 950, 700]},
+    "fishing": {
+        "enabled": True,
+        "minimap": {"center_x": 50, "center_y": 60, "radius": 70.0},
+        "polling_area": {"x": 899, "y": 649, "color": "00FF00"},
+        "drop_boxes": [
+            {"x1": 800, "y1": 400, "x2": 830, "y2": 430, "color": "FFFFFF"},
+            {"x1": 900, "y1": 400, "x2": 930, "y2": 430, "color": "FFFFFF"},
+        ],
+    },
+}
+
+def test_locate_elements_flags_out_of_window_elements():
+    elements = visualize_config._config_elements(CONFIG)
+    located = visualize_config._locate_elements(elements, WINDOW)
+
+    inside = {name: is_inside for (_, name, *_), (_, is_inside) in zip(elements, located)}
+    assert inside == {
+        "health bar position": True,
+        "food area": True,
+        "inventory area": False,  # bottom edge below the window
+        "minimap center": False,  # left of the window
+        "polling area": True,  # last pixel of the window
+        "drop box 1": True,
+        "drop box 2": False,  # right edge past the window
+    }
+
+def test_locate_elements_translates_to_window_coordinates():
+    elements = visualize_config._config_elements(CONFIG)
+    located = dict(zip((name for _, name, *_ in elements),
+                       (rel for rel, _ in visualize_config._locate_elements(elements, WINDOW))))
+
+    assert located["health bar position"] == (50, 30, 50, 30)
+    assert located["food area"] == (100, 50, 160, 110)
+
+def test_check_config_reports_only_out_of_window_elements():
+    warnings = visualize_config.check_config(CONFIG, WINDOW)
+
+    assert warnings == [
+        "Inventory area is outside window bounds",
+        "Minimap center (-50, 10) is outside window bounds",
+        "Drop box 2 is outside window bounds",
+    ]
+
+def test_locate_elements_without_elements():
+    assert visualize_config._locate_elements([], WINDOW) == []